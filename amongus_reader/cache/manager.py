@@ -42,6 +42,8 @@ class CacheManager:
         if not types:
             self._store.clear()
             return
+        if isinstance(types, str):
+            types = (types,)
         types_norm = {self._norm_type(t) for t in types}
         to_delete = [k for k in self._store.keys() if (k[0] in types_norm and (subkey is None or k[1] == subkey))]
         for k in to_delete:
@@ -53,6 +55,8 @@ class CacheManager:
     def snapshot(self, types: Optional[Iterable[str]] = None) -> Dict[str, Dict[Optional[Any], Any]]:
         now = time.time()
         res: Dict[str, Dict[Optional[Any], Any]] = {}
+        if isinstance(types, str):
+            types = (types,)
         types_norm = {self._norm_type(t) for t in types} if types else None
         for (typ, sub), (expires, val) in list(self._store.items()):
             if types_norm is not None and typ not in types_norm:
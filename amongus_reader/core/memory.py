@@ -88,13 +88,19 @@ class MemoryClient:
         return True
 
     # primitives
+    def _rpm(self, addr: int, buf, size: int) -> None:
+        """ReadProcessMemory straight into a ctypes buffer (or byref of one)."""
+        nread = ctypes.c_size_t()
+        ok = self._kernel32.ReadProcessMemory(self.pm.process_handle, ctypes.c_void_p(int(addr)), buf, size, ctypes.byref(nread))
+        if not ok or nread.value != size:
+            raise pymem.exception.MemoryReadError(addr, size, self._kernel32.GetLastError())
+
     def read_ptr(self, addr: int) -> int:
         if not self.is_address_committed(addr):
             raise pymem.exception.MemoryReadError(addr, 8 if self.is_64 else 4, 299)
-        if self.is_64:
-            return self.pm.read_ulonglong(addr)
-        else:
-            return self.pm.read_uint(addr)
+        val = ctypes.c_uint64() if self.is_64 else ctypes.c_uint32()
+        self._rpm(addr, ctypes.byref(val), ctypes.sizeof(val))
+        return val.value
 
     def read_u32(self, addr: int) -> int:
         return self.pm.read_uint(addr)
@@ -109,7 +115,29 @@ class MemoryClient:
         return self.pm.read_int(addr)
 
     def read_bytes(self, addr: int, size: int) -> bytes:
-        return bytes(self.pm.read_bytes(addr, size))
+        buf = ctypes.create_string_buffer(size)
+        self._rpm(addr, buf, size)
+        return buf.raw
+
+    def read_into(self, dst: bytearray, addr: int, size: int) -> int:
+        """Fill dst[:size] from remote memory in place (no intermediate bytes object)."""
+        if size > len(dst):
+            raise ValueError("destination buffer too small")
+        self._rpm(addr, (ctypes.c_char * size).from_buffer(dst), size)
+        return size
+
+    def read_scatter(self, addrs: List[int], size: int) -> List[Optional[bytes]]:
+        """size bytes from each address through one reused buffer; None where a read fails."""
+        buf = ctypes.create_string_buffer(size)
+        out: List[Optional[bytes]] = []
+        for addr in addrs:
+            try:
+                self._rpm(addr, buf, size)
+            except Exception:
+                out.append(None)
+                continue
+            out.append(buf.raw)
+        return out
 
     def write_bytes(self, addr: int, data: bytes) -> None:
         self.pm.write_bytes(addr, data, len(data))
@@ -245,6 +273,34 @@ class MemoryClient:
                 count += 1
             addr = base + size
 
+    def iter_committed_regions_in(self, start: int, end: int) -> List[Tuple[int, int]]:
+        """Committed, readable, non-guard spans of [start, end), clipped to the window."""
+        PAGE_GUARD = 0x100
+        MEM_COMMIT = 0x1000
+        readable = {0x02, 0x04, 0x08, 0x20, 0x40, 0x80}
+
+        out: List[Tuple[int, int]] = []
+        addr = start
+        while addr < end:
+            info = self._virtual_query(addr)
+            if info is None:
+                addr += 0x10000
+                continue
+            base = int(info.BaseAddress or 0)
+            size = int(info.RegionSize)
+            if size <= 0:
+                break
+            prot = int(info.Protect)
+            if int(info.State) == MEM_COMMIT and prot in readable and (prot & PAGE_GUARD) == 0:
+                lo = max(addr, base)
+                hi = min(end, base + size)
+                if out and out[-1][0] + out[-1][1] == lo:
+                    out[-1] = (out[-1][0], hi - out[-1][0])
+                else:
+                    out.append((lo, hi - lo))
+            addr = base + size
+        return out
+
     def iter_heap_regions(self, max_regions: int = 4096) -> Iterator[Tuple[int, int]]:
         kernel32 = ctypes.windll.kernel32
         PROCESS = self.pm.process_handle
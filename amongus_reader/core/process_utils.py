@@ -1,12 +1,17 @@
 from __future__ import annotations
 
-import os
+import time
 from functools import lru_cache
-from typing import Iterable
+from typing import Dict, Tuple
 
 import psutil
 
 
+# Process enumeration is expensive; reuse the last answer per name for a short window.
+_RUNNING_CACHE_TTL = 1.5
+_running_cache: Dict[str, Tuple[float, bool]] = {}
+
+
 @lru_cache(maxsize=1)
 def _normalized_candidates(process_name: str) -> tuple[str, ...]:
     """Return normalized executable name candidates for matching."""
@@ -17,26 +22,25 @@ def _normalized_candidates(process_name: str) -> tuple[str, ...]:
     return tuple(sorted(filter(None, candidates)))
 
 
-def _iter_process_names() -> Iterable[str]:
-    for proc in psutil.process_iter(["name", "exe"]):
-        info = proc.info
-        for key in ("name", "exe"):
-            value = info.get(key)
-            if not value:
-                continue
-            base = os.path.basename(str(value)).strip().lower()
-            if base:
-                yield base
+def is_process_running(process_name: str = "Among Us.exe") -> bool:
+    """Return True if a process with the given name is running (cached for a short TTL)."""
+    now = time.monotonic()
+    cached = _running_cache.get(process_name)
+    if cached is not None and now - cached[0] < _RUNNING_CACHE_TTL:
+        return cached[1]
+    result = _scan_for_process(process_name)
+    _running_cache[process_name] = (now, result)
+    return result
 
 
-def is_process_running(process_name: str = "Among Us.exe") -> bool:
-    """Return True if a process with the given name is running."""
+def _scan_for_process(process_name: str) -> bool:
     candidates = set(_normalized_candidates(process_name))
     try:
-        for pname in _iter_process_names():
-            if pname in candidates:
+        # Only "name": asking for "exe" opens every process handle and dominates the cost.
+        for proc in psutil.process_iter(["name"]):
+            name = proc.info.get("name")
+            if name and str(name).strip().lower() in candidates:
                 return True
     except Exception:
         return False
     return False
-
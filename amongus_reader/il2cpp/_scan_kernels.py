@@ -0,0 +1,98 @@
+"""Hot-loop kernels for Il2CppScanner's pointer sweeps.
+
+With numba installed these are compiled loops over the chunk arrays that stop at
+the first hit; without it the same functions fall back to NumPy.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+HAVE_NUMBA = njit is not None
+
+
+def _find_eq_py(arr: np.ndarray, target: int, limit: int) -> np.ndarray:
+    return np.flatnonzero(arr == target)[:limit]
+
+
+def _find_in_range_py(arr: np.ndarray, lo: int, hi: int) -> np.ndarray:
+    return np.flatnonzero((arr >= lo) & (arr < hi))
+
+
+def _find_isin_py(arr: np.ndarray, targets: np.ndarray, limit: int) -> np.ndarray:
+    return np.flatnonzero(np.isin(arr, targets))[:limit]
+
+
+def _count_isin_py(arr: np.ndarray, targets: np.ndarray, need: int) -> int:
+    return int(np.count_nonzero(np.isin(arr, targets)))
+
+
+if HAVE_NUMBA:
+    @njit(cache=True)
+    def find_eq(arr, target, limit):
+        out = np.empty(min(limit, arr.shape[0]), dtype=np.int64)
+        n = 0
+        for i in range(arr.shape[0]):
+            if n >= out.shape[0]:
+                break
+            if arr[i] == target:
+                out[n] = i
+                n += 1
+        return out[:n]
+
+    @njit(cache=True)
+    def find_in_range(arr, lo, hi):
+        out = np.empty(arr.shape[0], dtype=np.int64)
+        n = 0
+        for i in range(arr.shape[0]):
+            v = arr[i]
+            if v >= lo and v < hi:
+                out[n] = i
+                n += 1
+        return out[:n]
+
+    @njit(cache=True)
+    def find_isin(arr, targets, limit):
+        out = np.empty(min(limit, arr.shape[0]), dtype=np.int64)
+        n = 0
+        for i in range(arr.shape[0]):
+            if n >= out.shape[0]:
+                break
+            v = arr[i]
+            for j in range(targets.shape[0]):
+                if v == targets[j]:
+                    out[n] = i
+                    n += 1
+                    break
+        return out[:n]
+
+    @njit(cache=True)
+    def count_isin(arr, targets, need):
+        # Stops as soon as `need` slots matched; callers only compare the count against it.
+        hits = 0
+        for i in range(arr.shape[0]):
+            v = arr[i]
+            for j in range(targets.shape[0]):
+                if v == targets[j]:
+                    hits += 1
+                    break
+            if hits >= need:
+                break
+        return hits
+
+    # Compile (or load from the on-disk cache) for both pointer widths now rather than mid-scan.
+    for _dt in (np.uint64, np.uint32):
+        _warm = np.zeros(2, dtype=_dt)
+        find_eq(_warm, 0, 1)
+        find_in_range(_warm, 0, 1)
+        find_isin(_warm, np.zeros(1, dtype=_dt), 1)
+        count_isin(_warm, np.zeros(1, dtype=_dt), 1)
+    del _dt, _warm
+else:
+    find_eq = _find_eq_py
+    find_in_range = _find_in_range_py
+    find_isin = _find_isin_py
+    count_isin = _count_isin_py
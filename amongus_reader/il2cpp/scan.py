@@ -1,17 +1,114 @@
 from __future__ import annotations
 
+import threading
 import time
-from typing import List, Optional, Tuple
+from typing import Collection, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
 
 from ..core.memory import MemoryClient
+from . import _scan_kernels as _k
 from .meta import MetaIndex
 
+# Scan windows are pulled with one read_bytes per chunk and decoded as a NumPy
+# pointer array; a failed chunk is retried page by page so readable pages still count.
+_SCAN_CHUNK = 0x100000
+_PAGE_SIZE = 0x1000
+# Instances of a class cluster, so a repeat heap scan first looks this far either side of its last hit.
+_HINT_RADIUS = 0x10000
+# Il2CppClass::static_fields offsets seen across builds, probed in order from one read of the class header.
+_STATIC_FIELDS_CANDIDATES = (0xB8, 0xB0, 0xD8, 0xD0, 0x5C)
+_STATIC_FIELDS_SPAN = 0xE0
+# Field offsets at which a button may hold its label string, tried nearest first.
+_BTN_LABEL_FIELD_OFFS = (0x20, 0x28, 0x30, 0x38, 0x40, 0x48, 0x50, 0x60, 0x70, 0x80)
+_PTR_DTYPE_64 = np.dtype("<u8")
+_PTR_DTYPE_32 = np.dtype("<u4")
+
 
 class Il2CppScanner:
     def __init__(self, memory: MemoryClient, meta: MetaIndex, debug: bool = False) -> None:
         self.memory = memory
         self.meta = meta
         self.debug = bool(debug)
+        # Pointer width never changes for an attached process; resolve the derived layout once.
+        is_64 = bool(memory.is_64)
+        self._dtype = _PTR_DTYPE_64 if is_64 else _PTR_DTYPE_32
+        self._step = 8 if is_64 else 4
+        self._fields_off = 0x10 if is_64 else 0x8
+        # Reused destination for chunk reads, one per thread; arrays handed out by _read_ptr_array view it.
+        self._tls = threading.local()
+        # target_klass -> address of its most recent heap hit
+        self._klass_hint: Dict[int, int] = {}
+        # klass -> resolved static fields pointer
+        self._static_fields: Dict[int, int] = {}
+
+    def _read_ptr_array(self, addr: int, size: int) -> Optional[np.ndarray]:
+        """[addr, addr+size) as pointer-width integers from a single read; None if unreadable.
+
+        The array is a view of the scratch buffer and is only valid until the next read.
+        """
+        dtype = self._dtype
+        size -= size % dtype.itemsize
+        if size <= 0:
+            return None
+        if size > _SCAN_CHUNK:
+            try:
+                buf = self.memory.read_bytes(addr, size)
+            except Exception:
+                return None
+            return np.frombuffer(buf, dtype=dtype)
+        scratch = getattr(self._tls, "scratch", None)
+        if scratch is None:
+            scratch = self._tls.scratch = bytearray(_SCAN_CHUNK)
+        try:
+            self.memory.read_into(scratch, addr, size)
+        except Exception:
+            return None
+        return np.frombuffer(scratch, dtype=dtype, count=size // dtype.itemsize)
+
+    def _ptr_array(self, values: Iterable[int]) -> np.ndarray:
+        """values in the scan arrays' pointer dtype, so kernels see one signature per width.
+
+        Values that do not fit the pointer width can never match a slot and are dropped.
+        """
+        limit = 1 << (8 * self._step)
+        return np.fromiter((v for v in values if 0 <= v < limit), dtype=self._dtype)
+
+    def _iter_ptr_blocks(self, start: int, size: int, chunk: int = _SCAN_CHUNK) -> Iterator[Tuple[int, np.ndarray]]:
+        """Yield (block_addr, values) covering [start, start+size), skipping unreadable pages."""
+        end = start + size
+        cur = start
+        while cur < end:
+            n = min(chunk, end - cur)
+            arr = self._read_ptr_array(cur, n)
+            if arr is not None:
+                yield cur, arr
+            elif cur // _PAGE_SIZE != (cur + n - 1) // _PAGE_SIZE:
+                # The span crosses a page boundary, so some of its pages may still be readable
+                yield from self._iter_page_blocks(cur, cur + n)
+            cur += n
+
+    def _iter_page_blocks(self, start: int, stop: int) -> Iterator[Tuple[int, np.ndarray]]:
+        """Read [start, stop) one page at a time, staying on start's pointer grid."""
+        step = self._step
+        cur = start
+        while cur < stop:
+            pn = min((cur // _PAGE_SIZE + 1) * _PAGE_SIZE, stop) - cur
+            # A pointer that straddles the boundary gets a read of its own
+            pn = pn - pn % step or step
+            arr = self._read_ptr_array(cur, pn)
+            if arr is not None:
+                yield cur, arr
+            cur += pn
+
+    def _default_regions(self) -> List[Tuple[int, int]]:
+        """The four 16 MiB windows after GameAssembly's base, pruned to committed readable pages."""
+        b = self.memory.base
+        windows = [(b + off, 0x01000000) for off in (0x01000000, 0x02000000, 0x03000000, 0x04000000)]
+        try:
+            return [r for start, size in windows for r in self.memory.iter_committed_regions_in(start, start + size)]
+        except Exception:
+            return windows
 
     def _is_asm_ptr(self, ptr: int) -> bool:
         try:
@@ -35,40 +132,46 @@ class Il2CppScanner:
     def get_static_fields_ptr(self, klass: int) -> int:
         if not klass:
             return 0
-        candidates = [0xB8, 0xB0, 0xD8, 0xD0, 0x5C]
-        for off in candidates:
-            try:
-                p = self.memory.read_ptr(klass + off)
-                if p:
-                    return p
-            except Exception:
-                continue
-        return 0
+        cached = self._static_fields.get(klass)
+        if cached:
+            return cached
+        ptr_sz = self._step
+        try:
+            blob = self.memory.read_bytes(klass, _STATIC_FIELDS_SPAN)
+        except Exception:
+            blob = b""
+        p = 0
+        for off in _STATIC_FIELDS_CANDIDATES:
+            if blob:
+                p = int.from_bytes(blob[off:off + ptr_sz], "little")
+            else:
+                try:
+                    p = self.memory.read_ptr(klass + off)
+                except Exception:
+                    continue
+            if p:
+                break
+        if p:
+            # Static storage is allocated once per class, so a non-null pointer stays valid for this attach
+            self._static_fields[klass] = p
+        return p
 
     def scan_fields_for_class(self, fields_base: int, span_bytes: int, target_klass: int) -> int:
-        step = 8 if self.memory.is_64 else 4
-        end = fields_base + span_bytes
-        for cur in range(fields_base, end, step):
-            try:
-                ptr = self.memory.read_ptr(cur)
-                if ptr:
-                    k = self.memory.read_ptr(ptr)
-                    if k == target_klass:
+        for _addr, arr in self._iter_ptr_blocks(fields_base, span_bytes):
+            for ptr in arr[arr != 0].tolist():
+                try:
+                    if self.memory.read_ptr(ptr) == target_klass:
                         return ptr
-            except Exception:
-                continue
+                except Exception:
+                    continue
         return 0
 
     def scan_fields_for_ptr_value(self, fields_base: int, span_bytes: int, target_ptr: int) -> int:
-        step = 8 if self.memory.is_64 else 4
-        end = fields_base + span_bytes
-        for cur in range(fields_base, end, step):
-            try:
-                ptr = self.memory.read_ptr(cur)
-                if ptr == target_ptr:
-                    return cur
-            except Exception:
-                continue
+        step = self._step
+        for addr, arr in self._iter_ptr_blocks(fields_base, span_bytes):
+            hits = _k.find_eq(arr, target_ptr, 1)
+            if hits.size:
+                return addr + int(hits[0]) * step
         return 0
 
     def scan_heap_for_class_instances(
@@ -81,170 +184,196 @@ class Il2CppScanner:
         if not target_klass:
             return []
         found: List[int] = []
-        step = 8 if self.memory.is_64 else 4
         try:
             if regions is None:
-                b = self.memory.base
-                regions = [
-                    (b + 0x01000000, 0x01000000),
-                    (b + 0x02000000, 0x01000000),
-                    (b + 0x03000000, 0x01000000),
-                    (b + 0x04000000, 0x01000000),
-                ]
-            for start, size in regions:
-                if time_budget_end and time.time() > time_budget_end:
-                    break
-                end = start + size
-                cur = start
-                while cur < end and len(found) < limit:
-                    if time_budget_end and time.time() > time_budget_end:
-                        break
-                    try:
-                        obj = self.memory.read_ptr(cur)
-                        if obj == target_klass:
-                            found.append(cur)
-                        cur += step
-                    except Exception:
-                        cur += step
-                        continue
-                if len(found) >= limit:
-                    break
+                regions = self._default_regions()
+            window = self._hint_window(self._klass_hint.get(target_klass), regions)
+            # The small window around the last hit is read first so a budget-limited sweep
+            # still sees it; results always come out in region order.
+            near = self._collect_eq(target_klass, [window], limit, time_budget_end) if window else []
+            found = self._collect_eq(target_klass, regions, limit, time_budget_end)
+            if near and len(found) < limit and time_budget_end and time.monotonic() > time_budget_end:
+                # The sweep was cut short: add the near hits it did not reach, in sweep order.
+                found = sorted(set(found).union(near), key=lambda a: (self._region_index(a, regions), a))[:limit]
         except Exception:
             return found
+        if found:
+            self._klass_hint[target_klass] = found[0]
         return found
 
-    def object_fields_contains_ptr(self, obj_ptr: int, target_ptr: int, span: int = 0x200) -> bool:
-        try:
-            fields_off = 0x10 if self.memory.is_64 else 0x8
-            base = obj_ptr + fields_off
-            step = 8 if self.memory.is_64 else 4
-            end = base + max(0x40, span)
-            for cur in range(base, end, step):
-                try:
-                    p = self.memory.read_ptr(cur)
-                    if p == target_ptr:
-                        return True
-                except Exception:
+    def scan_heap_for_any_of(
+        self,
+        klasses: Collection[int],
+        regions: Optional[List[Tuple[int, int]]] = None,
+        limit: Optional[int] = None,
+        time_budget_end: Optional[float] = None,
+    ) -> Dict[int, int]:
+        """One sweep for several klasses: {klass: first instance address}.
+
+        Stops once `limit` distinct klasses (all of them by default) have been found.
+        """
+        targets = frozenset(k for k in klasses if k)
+        if not targets:
+            return {}
+        want = len(targets) if limit is None else min(limit, len(targets))
+        found: Dict[int, int] = {}
+        if regions is None:
+            regions = self._default_regions()
+        step = self._step
+        pending = self._ptr_array(targets)
+        for start, size in regions:
+            if time_budget_end and time.monotonic() > time_budget_end:
+                break
+            for addr, arr in self._iter_ptr_blocks(start, size):
+                if time_budget_end and time.monotonic() > time_budget_end:
+                    break
+                idx = _k.find_isin(arr, pending, arr.shape[0])
+                if not idx.size:
                     continue
-        except Exception:
-            return False
+                for i, klass in zip(idx.tolist(), arr[idx].tolist()):
+                    if klass not in found:
+                        found[klass] = addr + i * step
+                        self._klass_hint[klass] = found[klass]
+                if len(found) >= want:
+                    return found
+                pending = self._ptr_array(k for k in targets if k not in found)
+        return found
+
+    def _collect_eq(self, target: int, regions: List[Tuple[int, int]], limit: int, time_budget_end: Optional[float]) -> List[int]:
+        found: List[int] = []
+        step = self._step
+        for start, size in regions:
+            if time_budget_end and time.monotonic() > time_budget_end:
+                break
+            for addr, arr in self._iter_ptr_blocks(start, size):
+                if time_budget_end and time.monotonic() > time_budget_end:
+                    break
+                idx = _k.find_eq(arr, target, limit - len(found))
+                if idx.size:
+                    found.extend(addr + i * step for i in idx.tolist())
+                    if len(found) >= limit:
+                        break
+            if len(found) >= limit:
+                break
+        return found
+
+    @staticmethod
+    def _region_index(addr: int, regions: List[Tuple[int, int]]) -> int:
+        for i, (start, size) in enumerate(regions):
+            if start <= addr < start + size:
+                return i
+        return len(regions)
+
+    @staticmethod
+    def _hint_window(hint: Optional[int], regions: List[Tuple[int, int]]) -> Optional[Tuple[int, int]]:
+        """The +-_HINT_RADIUS window around hint, clipped to the region containing it."""
+        if not hint:
+            return None
+        for start, size in regions:
+            if start <= hint < start + size:
+                lo = max(start, hint - _HINT_RADIUS)
+                hi = min(start + size, hint + _HINT_RADIUS)
+                return lo, hi - lo
+        return None
+
+    def object_fields_contains_ptr(self, obj_ptr: int, target_ptr: int, span: int = 0x200) -> bool:
+        for _addr, arr in self._iter_ptr_blocks(obj_ptr + self._fields_off, max(0x40, span)):
+            if _k.find_eq(arr, target_ptr, 1).size:
+                return True
         return False
 
     def scan_object_field_ptrs(self, obj_ptr: int, span: int = 0x800) -> List[int]:
         out: List[int] = []
-        try:
-            fields_off = 0x10 if self.memory.is_64 else 0x8
-            base = obj_ptr + fields_off
-            step = 8 if self.memory.is_64 else 4
-            end = base + max(0x100, span)
-            for cur in range(base, end, step):
-                try:
-                    p = self.memory.read_ptr(cur)
-                    if p:
-                        out.append(p)
-                        if len(out) >= 512:
-                            break
-                except Exception:
-                    continue
-        except Exception:
-            return out
+        for _addr, arr in self._iter_ptr_blocks(obj_ptr + self._fields_off, max(0x100, span)):
+            out.extend(arr[arr != 0][: 512 - len(out)].tolist())
+            if len(out) >= 512:
+                break
         return out
 
-    def class_has_methods(self, klass: int, methods: List[int]) -> bool:
+    def class_has_methods(self, klass: int, methods: Collection[int]) -> bool:
         if not klass or not methods:
             return False
-        step = 8 if self.memory.is_64 else 4
-        scan_span = 0x10000
         try:
-            hits = 0
-            for addr in range(klass, klass + scan_span, step):
-                try:
-                    p = self.memory.read_ptr(addr)
-                    if p in methods:
-                        hits += 1
-                        if hits >= min(2, len(methods)):
-                            return True
-                except Exception:
-                    continue
+            methods_set = methods if isinstance(methods, (set, frozenset)) else frozenset(methods)
+            methods_arr = self._ptr_array(methods_set)
+            return self._klass_has_methods(klass, methods_arr, min(2, len(methods_set)))
         except Exception:
             return False
+
+    def _klass_has_methods(self, klass: int, methods_arr: np.ndarray, need: int, scan_span: int = 0x10000) -> bool:
+        hits = 0
+        for _addr, arr in self._iter_ptr_blocks(klass, scan_span):
+            hits += int(_k.count_isin(arr, methods_arr, need - hits))
+            if hits >= need:
+                return True
         return False
 
-    def find_object_by_method_signature(self, methods: List[int], time_budget_end: Optional[float]) -> int:
+    def find_object_by_method_signature(self, methods: Collection[int], time_budget_end: Optional[float]) -> int:
         if not methods:
             return 0
+        methods_set = methods if isinstance(methods, (set, frozenset)) else frozenset(methods)
         b = self.memory.base
         try:
-            hi = max(methods)
+            hi = max(methods_set)
         except Exception:
             hi = b + 0x05000000
         asm_max = max(b + 0x05000000, hi + 0x00100000)
         regions = list(self.memory.iter_heap_regions(max_regions=4096))
-        step = 8 if self.memory.is_64 else 4
-        scan_span = 0x10000
+        step = self._step
+        methods_arr = self._ptr_array(methods_set)
+        need = min(2, len(methods_set))
+        # Many heap objects share a klass; check each klass's method table only once per sweep.
+        checked = {}
         for start, size in regions:
-            if time_budget_end and time.time() > time_budget_end:
+            if time_budget_end and time.monotonic() > time_budget_end:
                 break
-            end = start + size
-            cur = start
-            while cur < end:
-                if time_budget_end and time.time() > time_budget_end:
+            for addr, arr in self._iter_ptr_blocks(start, size):
+                if time_budget_end and time.monotonic() > time_budget_end:
                     break
-                try:
-                    obj = cur
-                    klass = self.memory.read_ptr(obj)
-                    if klass and (b <= klass < asm_max):
-                        hits = 0
-                        for addr in range(klass, klass + scan_span, step):
-                            try:
-                                p = self.memory.read_ptr(addr)
-                                if p in methods:
-                                    hits += 1
-                                    if hits >= min(2, len(methods)):
-                                        return obj
-                            except Exception:
-                                continue
-                    cur += step
-                except Exception:
-                    cur += step
+                idx = _k.find_in_range(arr, b, asm_max)
+                if not idx.size:
                     continue
+                for i, klass in zip(idx.tolist(), arr[idx].tolist()):
+                    ok = checked.get(klass)
+                    if ok is None:
+                        if time_budget_end and time.monotonic() > time_budget_end:
+                            return 0
+                        ok = self._klass_has_methods(klass, methods_arr, need)
+                        checked[klass] = ok
+                    if ok:
+                        return addr + i * step
         return 0
 
-    def find_button_by_string_xref(self, str_va: int, btn_klasses: List[int], time_budget_end: Optional[float]) -> int:
+    def find_button_by_string_xref(self, str_va: int, btn_klasses: Collection[int], time_budget_end: Optional[float]) -> int:
         if not str_va:
             return 0
-        b = self.memory.base
-        regions = [
-            (b + 0x01000000, 0x01000000),
-            (b + 0x02000000, 0x01000000),
-            (b + 0x03000000, 0x01000000),
-            (b + 0x04000000, 0x01000000),
-        ]
-        step = 8 if self.memory.is_64 else 4
-        fields_off = 0x10 if self.memory.is_64 else 0x8
+        btn_set = frozenset(btn_klasses)
+        regions = self._default_regions()
+        step = self._step
+        fields_off = self._fields_off
+        # Slot distance from a string reference back to the klass pointer of its owning object
+        back = [(foff + fields_off) // step for foff in _BTN_LABEL_FIELD_OFFS]
         for start, size in regions:
-            if time_budget_end and time.time() > time_budget_end:
+            if time_budget_end and time.monotonic() > time_budget_end:
                 break
-            end = start + size
-            cur = start
-            while cur < end:
-                if time_budget_end and time.time() > time_budget_end:
+            for addr, arr in self._iter_ptr_blocks(start, size):
+                if time_budget_end and time.monotonic() > time_budget_end:
                     break
-                try:
-                    val = self.memory.read_ptr(cur)
-                    if val == str_va:
-                        for foff in (0x20, 0x28, 0x30, 0x38, 0x40, 0x48, 0x50, 0x60, 0x70, 0x80):
-                            obj_base = cur - foff - fields_off
-                            if obj_base <= 0:
-                                continue
-                            try:
-                                k = self.memory.read_ptr(obj_base)
-                                if k and (k in btn_klasses):
-                                    return obj_base
-                            except Exception:
-                                continue
-                    cur += step
-                except Exception:
-                    cur += step
-                    continue
+                for i in _k.find_eq(arr, str_va, arr.shape[0]).tolist():
+                    for nb in back:
+                        j = i - nb
+                        if j >= 0:
+                            # The candidate header lies in this block; no read needed
+                            if int(arr[j]) in btn_set:
+                                return addr + j * step
+                            continue
+                        obj_base = addr + j * step
+                        if obj_base <= 0:
+                            continue
+                        try:
+                            k = self.memory.read_ptr(obj_base)
+                        except Exception:
+                            continue
+                        if k and (k in btn_set):
+                            return obj_base
         return 0
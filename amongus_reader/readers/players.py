@@ -15,6 +15,8 @@ class PlayersReader:
         self._last_pc_map_ts: float = 0.0
         self._pc_map_ttl: float = 1.0  # seconds
         self._pc_klass: Optional[int] = None
+        # color_id -> (verified PlayerControl pointer, its CustomNetworkTransform fields address)
+        self._cnt_by_color_id: Dict[int, Tuple[int, int]] = {}
         self._last_known_count: int = 0
 
     def list_players(self) -> List[PlayerData]:
@@ -34,40 +36,25 @@ class PlayersReader:
         return self._ds.get_player_by_color(cid)
 
     def positions(self) -> Dict[int, Tuple[float, float]]:
-        # Per-call fast path: reuse PlayerControl pointers and only read positions
+        # Per-call fast path: reuse PlayerControl/NetTransform pointers and only read positions
         # Returns dict with color_id as key
         self._ensure_pc_map()
         out: Dict[int, Tuple[float, float]] = {}
         if not self._pc_by_color_id:
             return out
-        removed = 0
-        for color_id, pc_ptr in list(self._pc_by_color_id.items()):
-            try:
-                if not self._verify_pc_ptr(pc_ptr):
-                    self._pc_by_color_id.pop(color_id, None)
-                    removed += 1
-                    continue
-                pos = self._ds._get_player_position(pc_ptr)
-                if pos is not None:
-                    out[color_id] = pos
-            except Exception:
-                # If reading fails, drop this entry; it will be rebuilt on next map refresh
-                self._pc_by_color_id.pop(color_id, None)
-                removed += 1
+        stale = self._read_positions(list(self._pc_by_color_id), out)
+        for color_id in stale:
+            # Drop this entry; it will be rebuilt on next map refresh
+            self._forget(color_id)
         # Heuristics: if too many removed or count dropped significantly, rebuild immediately
-        if removed >= 2 or (self._last_known_count and len(out) < max(1, self._last_known_count // 2)):
+        if len(stale) >= 2 or (self._last_known_count and len(out) < max(1, self._last_known_count // 2)):
+            before = dict(self._pc_by_color_id)
             self._rebuild_pc_map(force=True)
-            # Try one more quick read if map rebuilt
-            out.clear()
-            for color_id, pc_ptr in list(self._pc_by_color_id.items()):
-                try:
-                    if not self._verify_pc_ptr(pc_ptr):
-                        continue
-                    pos = self._ds._get_player_position(pc_ptr)
-                    if pos is not None:
-                        out[color_id] = pos
-                except Exception:
-                    continue
+            # Keep first-pass reads only for players whose PlayerControl is unchanged
+            for color_id in list(out):
+                if self._pc_by_color_id.get(color_id) != before.get(color_id):
+                    del out[color_id]
+            self._read_positions([c for c in self._pc_by_color_id if c not in out], out)
         self._last_known_count = len(out)
         return out
 
@@ -89,18 +76,19 @@ class PlayersReader:
         try:
             if not self._ds.is_attached():
                 self._ds.attach()
-            fields_off = Offsets.OBJ_FIELDS_OFF_X64 if self._ds.memory and self._ds.memory.is_64 else Offsets.OBJ_FIELDS_OFF_X86
             new_map: Dict[int, int] = {}
             for npi in self._ds._get_all_npi_objects():
                 try:
-                    color_id = self._ds._get_player_color_id(npi)
-                    pc = self._ds._get_player_control_from_npi(npi)
+                    blob = self._ds._read_npi_fields(npi)
+                    color_id = self._ds._get_player_color_id(npi, blob)
+                    pc = self._ds._get_player_control_from_npi(npi, blob)
                     if 0 <= color_id <= 18 and pc:
                         new_map[int(color_id)] = int(pc)
                 except Exception:
                     continue
             if new_map:
                 self._pc_by_color_id = new_map
+                self._cnt_by_color_id.clear()
                 self._last_pc_map_ts = now
                 # refresh klass cache lazily
                 self._pc_klass = None
@@ -108,6 +96,45 @@ class PlayersReader:
             # leave old map if any
             pass
 
+    def _read_positions(self, color_ids: List[int], out: Dict[int, Tuple[float, float]]) -> List[int]:
+        # Fills out for the given mapped colors with one batched read; returns colors whose pointer went stale
+        stale: List[int] = []
+        live: List[Tuple[int, int]] = []
+        for color_id in color_ids:
+            pc_ptr = self._pc_by_color_id.get(color_id, 0)
+            if not self._verify_pc_ptr(pc_ptr):
+                self._cnt_by_color_id.pop(color_id, None)
+                stale.append(color_id)
+                continue
+            # The cached transform is only valid for the PlayerControl that was just verified
+            cached = self._cnt_by_color_id.get(color_id)
+            if cached is not None and cached[0] == pc_ptr:
+                cnt = cached[1]
+            else:
+                cnt = self._ds._get_net_transform_fields(pc_ptr)
+                if not cnt:
+                    self._cnt_by_color_id.pop(color_id, None)
+                    continue
+                self._cnt_by_color_id[color_id] = (pc_ptr, cnt)
+            live.append((color_id, cnt))
+        if not live:
+            return stale
+        try:
+            positions = self._ds._read_positions_from_cnt([cnt for _, cnt in live])
+        except Exception:
+            return stale
+        for (color_id, _), pos in zip(live, positions):
+            if pos is None:
+                # re-resolve the transform next time
+                self._cnt_by_color_id.pop(color_id, None)
+            else:
+                out[color_id] = pos
+        return stale
+
+    def _forget(self, color_id: int) -> None:
+        self._pc_by_color_id.pop(color_id, None)
+        self._cnt_by_color_id.pop(color_id, None)
+
     def _verify_pc_ptr(self, pc_ptr: int) -> bool:
         try:
             if not pc_ptr or not self._ds.memory:
@@ -122,6 +149,7 @@ class PlayersReader:
     # External controls
     def invalidate_pc_map(self) -> None:
         self._pc_by_color_id.clear()
+        self._cnt_by_color_id.clear()
         self._last_pc_map_ts = 0.0
         self._pc_klass = None
         self._last_known_count = 0
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import struct
 import time
 from collections import Counter
 from dataclasses import dataclass, field
@@ -32,7 +33,7 @@ _LOBBY_UI_TYPES = (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionSignals:
     lobby_ui_present: bool = False
     local_player_ptr: int = 0
@@ -46,6 +47,10 @@ class SessionSignals:
     errors: List[str] = field(default_factory=list)
     player_ids: List[int] = field(default_factory=list)
     client_slots: List[int] = field(default_factory=list)
+    # Scratch tallies filled alongside player_ids/client_slots so classification needs no
+    # second pass; derived from those lists, so they stay out of repr and equality.
+    id_counter: Counter = field(default_factory=Counter, repr=False, compare=False)
+    slot_counter: Counter = field(default_factory=Counter, repr=False, compare=False)
     gamedata_first_int: Optional[int] = None
     gamedata_state_int: Optional[int] = None
 
@@ -72,9 +77,13 @@ class SessionReader:
     """Derives coarse session state (LOBBY/MATCHING/SHIP) without Unity icalls."""
 
     _SCAN_TIME_BUDGET = 0.35
+    _KLASS_TTL = 2.0
 
     def __init__(self, ds: AmongUsDataService) -> None:
         self._ds = ds
+        # name -> (klass, resolved_at); tied to the MemoryClient it was resolved with
+        self._klass_cache: Dict[str, Tuple[int, float]] = {}
+        self._klass_cache_memory = None
 
     # ---------------------------------------------------------------------
     # Public API
@@ -100,7 +109,7 @@ class SessionReader:
             self._ds.attach()
 
         signals = SessionSignals()
-        time_budget_end = time.time() + self._SCAN_TIME_BUDGET
+        time_budget_end = time.monotonic() + self._SCAN_TIME_BUDGET
 
         self._check_lobby_ui(signals, time_budget_end)
         self._gather_player_signals(signals)
@@ -114,23 +123,19 @@ class SessionReader:
         return signals
 
     def _check_lobby_ui(self, signals: SessionSignals, time_budget_end: float) -> None:
-        for tname in _LOBBY_UI_TYPES:
-            if time.time() > time_budget_end:
-                break
-            klass = self._get_class_from_dotnet(tname)
-            if not klass:
-                continue
-            try:
-                insts = self._ds._scan_heap_for_class_instances(klass, limit=1, time_budget_end=time_budget_end)
-            except Exception:
-                insts = []
-            if insts:
-                signals.lobby_ui_present = True
-                break
+        klasses = [self._get_class_from_dotnet(tname) for tname in _LOBBY_UI_TYPES]
+        try:
+            hits = self._ds._scan_heap_for_any_of(klasses, limit=1, time_budget_end=time_budget_end)
+        except Exception:
+            hits = {}
+        if hits:
+            signals.lobby_ui_present = True
 
     def _gather_player_signals(self, signals: SessionSignals) -> None:
         signals.player_ids.clear()
         signals.client_slots.clear()
+        signals.id_counter.clear()
+        signals.slot_counter.clear()
         try:
             signals.local_player_ptr = self._ds._get_local_player_ptr()
         except Exception as exc:
@@ -147,6 +152,8 @@ class SessionReader:
         if not npi_objects:
             return
 
+        memory = self._ds.memory
+        fields_off = Offsets.OBJ_FIELDS_OFF_X64 if memory.is_64 else Offsets.OBJ_FIELDS_OFF_X86
         for npi in npi_objects:
             try:
                 pc_ptr = self._ds._get_player_control_from_npi(npi)
@@ -170,22 +177,24 @@ class SessionReader:
                     pass
             pid = None
             try:
-                fields_off = Offsets.OBJ_FIELDS_OFF_X64 if self._ds.memory.is_64 else Offsets.OBJ_FIELDS_OFF_X86
-                pid = self._ds.memory.read_u8(npi + fields_off + 0x8)
+                pid = memory.read_u8(npi + fields_off + 0x8)
             except Exception:
                 pid = None
             if pid is not None:
                 signals.player_ids.append(int(pid))
+                if 0 <= pid < 255:
+                    signals.id_counter[int(pid)] += 1
                 if pc_ptr and pc_ptr == signals.local_player_ptr:
                     signals.local_player_id = int(pid)
             client_slot = None
             try:
-                fields_off = Offsets.OBJ_FIELDS_OFF_X64 if self._ds.memory.is_64 else Offsets.OBJ_FIELDS_OFF_X86
-                client_slot = self._ds.memory.read_u32(npi + fields_off + 0x20)
+                client_slot = memory.read_u32(npi + fields_off + 0x20)
             except Exception:
                 client_slot = None
             if client_slot is not None:
                 signals.client_slots.append(int(client_slot))
+                if client_slot >= 0:
+                    signals.slot_counter[int(client_slot)] += 1
             if signals.any_pc_pos and signals.any_clientdata:
                 break
 
@@ -197,19 +206,16 @@ class SessionReader:
             signals.hud_ptr = 0
 
         hits: List[str] = []
-        for tname in _SHIP_STATUS_TYPES:
-            if time.time() > time_budget_end:
-                break
-            klass = self._get_class_from_dotnet(tname)
-            if not klass:
-                continue
+        if time.monotonic() <= time_budget_end:
+            klasses = {tname: self._get_class_from_dotnet(tname) for tname in _SHIP_STATUS_TYPES}
             try:
-                insts = self._ds._scan_heap_for_class_instances(klass, limit=1, time_budget_end=time_budget_end)
+                found = self._ds._scan_heap_for_any_of(list(klasses.values()), limit=1, time_budget_end=time_budget_end)
             except Exception:
-                insts = []
-            if insts:
-                hits.append(tname)
-                break
+                found = {}
+            for tname, klass in klasses.items():
+                if klass and klass in found:
+                    hits.append(tname)
+                    break
         signals.ship_status_hits = hits
 
     def _read_gamedata_ints(self, count: int = 8) -> Optional[List[int]]:
@@ -219,8 +225,7 @@ class SessionReader:
                 return None
             fields_off = Offsets.OBJ_FIELDS_OFF_X64 if self._ds.memory.is_64 else Offsets.OBJ_FIELDS_OFF_X86
             blob = self._ds.memory.read_bytes(inst + fields_off, count * 4)
-            ints = [int.from_bytes(blob[i : i + 4], "little", signed=False) for i in range(0, len(blob), 4)]
-            return ints
+            return list(struct.unpack_from(f"<{len(blob) // 4}I", blob))
         except Exception:
             return None
 
@@ -263,15 +268,13 @@ class SessionReader:
                 return "LOBBY"
             joined_room = True
 
-        slot_counts = Counter(sl for sl in signals.client_slots if sl >= 0)
-        unique_slots = sum(1 for count in slot_counts.values() if count >= 1)
+        unique_slots = len(signals.slot_counter)
         if unique_slots >= 2:
             joined_room = True
         elif game_first is None:
             return "LOBBY"
 
-        valid_ids = [pid for pid in signals.player_ids if 0 <= pid < 255]
-        id_counts = Counter(valid_ids)
+        id_counts = signals.id_counter
         if id_counts:
             repeated = any(count > 1 for count in id_counts.values())
             if len(id_counts) == 1 and repeated and not signals.any_clientdata and unique_slots <= 1 and not (game_first and game_first != 0):
@@ -299,10 +302,22 @@ class SessionReader:
         return None
 
     def _get_class_from_dotnet(self, name: str) -> int:
+        memory = self._ds.memory
+        if memory is not self._klass_cache_memory:
+            # re-attached (or detached): klass pointers from the old process are meaningless
+            self._klass_cache.clear()
+            self._klass_cache_memory = memory
+        now = time.time()
+        cached = self._klass_cache.get(name)
+        if cached is not None and now - cached[1] < self._KLASS_TTL:
+            return cached[0]
         try:
-            return self._ds._get_class_from_dotnet(name)
+            klass = self._ds._get_class_from_dotnet(name)
         except Exception:
             return 0
+        if klass:
+            self._klass_cache[name] = (klass, now)
+        return klass
 
 
 __all__ = ["SessionReader", "SessionSignals"]
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import ctypes
 from ctypes import wintypes
+import struct
 import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Collection, Dict, List, Optional, Tuple, Union
 
 from ..core.memory import MemoryClient
 from ..core.offsets import Offsets
@@ -13,6 +14,12 @@ from ..il2cpp.meta import MetaIndex
 from ..il2cpp.scan import Il2CppScanner
 from .task_lookup import system_type_to_name
 
+# NPI fields window [0, 0x80) read in one go by _read_npi_fields
+_NPI_FIELDS_SPAN = 0x80
+# CustomNetworkTransform lastPosition .. end of lastPosSent
+_CNT_POS_SPAN = Offsets.CNT_FIELDS_lastPosSent + 0x8 - Offsets.CNT_FIELDS_lastPosition
+_F32X2 = struct.Struct("<ff")
+
 
 class ColorId(Enum):
     RED = 0
@@ -67,8 +74,6 @@ class TaskData:
     start_system: Optional[int] = None
     location: Optional[str] = None
     destination: Optional[str] = None
-    step: Optional[int] = None
-    max_step: Optional[int] = None
 
 
 class AmongUsDataService:
@@ -295,20 +300,24 @@ class AmongUsDataService:
                 pass
         found: List[int] = []
         step = 8 if self.memory.is_64 else 4
+        read_ptr = self.memory.read_ptr
         try:
             if regions is None:
                 b = self.memory.base
                 regions = [(b + 0x01000000, 0x01000000), (b + 0x02000000, 0x01000000), (b + 0x03000000, 0x01000000), (b + 0x04000000, 0x01000000)]
             for start, size in regions:
-                if time_budget_end and time.time() > time_budget_end:
+                if time_budget_end and time.monotonic() > time_budget_end:
                     break
                 end = start + size
                 cur = start
+                n = 0
                 while cur < end and len(found) < limit:
-                    if time_budget_end and time.time() > time_budget_end:
+                    # Check the budget every 1024 slots rather than on each read
+                    if time_budget_end and (n & 0x3FF) == 0 and time.monotonic() > time_budget_end:
                         break
+                    n += 1
                     try:
-                        obj = self.memory.read_ptr(cur)
+                        obj = read_ptr(cur)
                         if obj == target_klass:
                             found.append(cur)
                         cur += step
@@ -321,6 +330,23 @@ class AmongUsDataService:
             return found
         return found
 
+    def _scan_heap_for_any_of(self, klasses: List[int], regions: Optional[List[Tuple[int,int]]] = None, limit: Optional[int] = None, time_budget_end: Optional[float] = None) -> Dict[int, int]:
+        if self._scanner:
+            try:
+                return self._scanner.scan_heap_for_any_of(klasses, regions, limit, time_budget_end)
+            except Exception:
+                pass
+        found: Dict[int, int] = {}
+        for klass in klasses:
+            if limit is not None and len(found) >= limit:
+                break
+            if not klass or klass in found:
+                continue
+            insts = self._scan_heap_for_class_instances(klass, regions, limit=1, time_budget_end=time_budget_end)
+            if insts:
+                found[klass] = insts[0]
+        return found
+
     def _object_fields_contains_ptr(self, obj_ptr: int, target_ptr: int, span: int = 0x200) -> bool:
         if self._scanner:
             try:
@@ -342,7 +368,7 @@ class AmongUsDataService:
             return False
         return False
 
-    def _class_has_methods(self, klass: int, methods: List[int]) -> bool:
+    def _class_has_methods(self, klass: int, methods: Collection[int]) -> bool:
         if self._scanner:
             try:
                 return self._scanner.class_has_methods(klass, methods)
@@ -350,16 +376,19 @@ class AmongUsDataService:
                 pass
         if not klass or not methods:
             return False
+        methods_set = methods if isinstance(methods, (set, frozenset)) else frozenset(methods)
+        need = min(2, len(methods_set))
         step = 8 if self.memory.is_64 else 4
         scan_span = 0x10000
+        read_ptr = self.memory.read_ptr
         try:
             hits = 0
             for addr in range(klass, klass + scan_span, step):
                 try:
-                    p = self.memory.read_ptr(addr)
-                    if p in methods:
+                    p = read_ptr(addr)
+                    if p in methods_set:
                         hits += 1
-                        if hits >= min(2, len(methods)):
+                        if hits >= need:
                             return True
                 except Exception:
                     continue
@@ -392,7 +421,7 @@ class AmongUsDataService:
             return out
         return out
 
-    def _find_object_by_method_signature(self, methods: List[int], time_budget_end: Optional[float]) -> int:
+    def _find_object_by_method_signature(self, methods: Collection[int], time_budget_end: Optional[float]) -> int:
         if self._scanner:
             try:
                 return self._scanner.find_object_by_method_signature(methods, time_budget_end)
@@ -406,8 +435,7 @@ class AmongUsDataService:
             return 0
         try:
             if self._scanner:
-                btn_klasses = [self._get_class_from_dotnet(n) for n in ("reportbutton", "actionbutton", "passivebutton")]
-                btn_klasses = [k for k in btn_klasses if k]
+                btn_klasses = frozenset(k for k in (self._get_class_from_dotnet(n) for n in ("reportbutton", "actionbutton", "passivebutton")) if k)
                 if btn_klasses:
                     obj = self._scanner.find_button_by_string_xref(str_va, btn_klasses, time_budget_end)
                     if obj:
@@ -423,11 +451,7 @@ class AmongUsDataService:
             return 0
         if self._scanner:
             try:
-                btn_klasses: List[int] = []
-                for tname in ("reportbutton", "actionbutton", "passivebutton"):
-                    k = self._get_class_from_dotnet(tname)
-                    if k:
-                        btn_klasses.append(k)
+                btn_klasses = frozenset(k for k in (self._get_class_from_dotnet(n) for n in ("reportbutton", "actionbutton", "passivebutton")) if k)
                 if btn_klasses:
                     obj = self._scanner.find_button_by_string_xref(str_va, btn_klasses, time_budget_end)
                     if obj:
@@ -442,7 +466,7 @@ class AmongUsDataService:
             if not insts:
                 continue
             for inst in insts:
-                if time_budget_end and time.time() > time_budget_end:
+                if time_budget_end and time.monotonic() > time_budget_end:
                     return 0
                 if self._object_fields_contains_ptr(inst, str_va, span=0x400):
                     return inst
@@ -472,7 +496,7 @@ class AmongUsDataService:
                             return inst
             static_fields = self._get_static_fields_ptr(hud_klass)
             if not static_fields:
-                endt = time.time() + self._report_scan_time_budget
+                endt = time.monotonic() + self._report_scan_time_budget
                 insts = self._scan_heap_for_class_instances(hud_klass, limit=4, time_budget_end=endt)
                 if insts:
                     self._hud_ptr_cache = insts[0]
@@ -482,7 +506,7 @@ class AmongUsDataService:
             if inst:
                 self._hud_ptr_cache = inst
                 return self._hud_ptr_cache
-            endt = time.time() + self._report_scan_time_budget
+            endt = time.monotonic() + self._report_scan_time_budget
             insts = self._scan_heap_for_class_instances(hud_klass, limit=4, time_budget_end=endt)
             if insts:
                 self._hud_ptr_cache = insts[0]
@@ -514,7 +538,7 @@ class AmongUsDataService:
                     if ptr:
                         self._report_ptr_cache = ptr
                         return self._report_ptr_cache
-            now = time.time()
+            now = time.monotonic()
             if now - self._report_scan_last < self._report_scan_min_interval:
                 return 0
             self._report_scan_last = now
@@ -538,10 +562,7 @@ class AmongUsDataService:
                     self._report_ptr_cache = obj
                     return self._report_ptr_cache
             try:
-                methods_abs: List[int] = []
-                for rva_hex in ("0x105007C0", "0x10500870"):
-                    rva = int(rva_hex, 16)
-                    methods_abs.append(self.memory.base + rva)
+                methods_abs = frozenset(self.memory.base + int(rva_hex, 16) for rva_hex in ("0x105007C0", "0x10500870"))
                 if methods_abs:
                     obj = self._find_object_by_method_signature(methods_abs, time_budget_end=endt)
                     if obj:
@@ -552,16 +573,16 @@ class AmongUsDataService:
             try:
                 seeds: List[int] = []
                 for rva_hex in ("0x10503820", "0x105002F0", "0x10503C70", "0x10500E50"):
-                    obj = self._find_object_by_method_signature([self.memory.base + int(rva_hex, 16)], time_budget_end=endt)
+                    obj = self._find_object_by_method_signature(frozenset((self.memory.base + int(rva_hex, 16),)), time_budget_end=endt)
                     if obj:
                         seeds.append(obj)
-                report_methods = [self.memory.base + int(x, 16) for x in ("0x105007C0", "0x10500870")]
+                report_methods = frozenset(self.memory.base + int(x, 16) for x in ("0x105007C0", "0x10500870"))
                 for seed in seeds:
-                    if time.time() > endt:
+                    if time.monotonic() > endt:
                         break
                     refs = self._scan_object_field_ptrs(seed, span=0x1200)
                     for ref in refs:
-                        if time.time() > endt:
+                        if time.monotonic() > endt:
                             break
                         try:
                             k = self.memory.read_ptr(ref)
@@ -653,24 +674,39 @@ class AmongUsDataService:
             return 0
 
     def _get_player_position(self, player_control_ptr: int) -> Optional[Tuple[float, float]]:
-        if not player_control_ptr:
-            return None
         try:
-            fields_off = Offsets.OBJ_FIELDS_OFF_X64 if self.memory.is_64 else Offsets.OBJ_FIELDS_OFF_X86
-            pc_fields = player_control_ptr + fields_off
-            net_transform = self.memory.read_ptr(pc_fields + Offsets.PC_FIELDS_NetTransform)
-            if not net_transform:
+            cnt_fields = self._get_net_transform_fields(player_control_ptr)
+            if not cnt_fields:
                 return None
-            cnt_fields = net_transform + fields_off
-            x = self.memory.read_f32(cnt_fields + Offsets.CNT_FIELDS_lastPosition + 0x0)
-            y = self.memory.read_f32(cnt_fields + Offsets.CNT_FIELDS_lastPosition + 0x4)
-            if x == 0.0 and y == 0.0:
-                x = self.memory.read_f32(cnt_fields + Offsets.CNT_FIELDS_lastPosSent + 0x0)
-                y = self.memory.read_f32(cnt_fields + Offsets.CNT_FIELDS_lastPosSent + 0x4)
-            return (x, y)
+            return self._read_positions_from_cnt([cnt_fields])[0]
         except Exception:
             return None
 
+    def _get_net_transform_fields(self, player_control_ptr: int) -> int:
+        # Fields address of the PlayerControl's CustomNetworkTransform; fixed for the PlayerControl's lifetime
+        if not player_control_ptr:
+            return 0
+        try:
+            fields_off = Offsets.OBJ_FIELDS_OFF_X64 if self.memory.is_64 else Offsets.OBJ_FIELDS_OFF_X86
+            net_transform = self.memory.read_ptr(player_control_ptr + fields_off + Offsets.PC_FIELDS_NetTransform)
+            return net_transform + fields_off if net_transform else 0
+        except Exception:
+            return 0
+
+    def _read_positions_from_cnt(self, cnt_fields: List[int]) -> List[Optional[Tuple[float, float]]]:
+        # lastPosition and lastPosSent are adjacent Vector2s; fetch both with one read per transform
+        blobs = self.memory.read_scatter([c + Offsets.CNT_FIELDS_lastPosition for c in cnt_fields], _CNT_POS_SPAN)
+        out: List[Optional[Tuple[float, float]]] = []
+        for blob in blobs:
+            if blob is None:
+                out.append(None)
+                continue
+            x, y = _F32X2.unpack_from(blob, 0)
+            if x == 0.0 and y == 0.0:
+                x, y = _F32X2.unpack_from(blob, Offsets.CNT_FIELDS_lastPosSent - Offsets.CNT_FIELDS_lastPosition)
+            out.append((x, y))
+        return out
+
     def _get_default_outfit_from_dict(self, dict_ptr: int) -> int:
         if not dict_ptr:
             return 0
@@ -709,7 +745,21 @@ class AmongUsDataService:
         except Exception:
             return -1
 
-    def _get_player_color_id(self, npi_ptr: int) -> int:
+    def _read_npi_fields(self, npi_ptr: int) -> bytes:
+        # One read covering every NPI field offset probed by the color/PlayerControl/player-id lookups
+        if not npi_ptr:
+            return b""
+        try:
+            fields_off = Offsets.OBJ_FIELDS_OFF_X64 if self.memory.is_64 else Offsets.OBJ_FIELDS_OFF_X86
+            return self.memory.read_bytes(npi_ptr + fields_off, _NPI_FIELDS_SPAN)
+        except Exception:
+            return b""
+
+    def _blob_ptr(self, blob: bytes, offset: int) -> int:
+        ptr_sz = 8 if self.memory.is_64 else 4
+        return int.from_bytes(blob[offset:offset + ptr_sz], "little")
+
+    def _get_player_color_id(self, npi_ptr: int, blob: Optional[bytes] = None) -> int:
         if not npi_ptr:
             return -1
         try:
@@ -717,7 +767,10 @@ class AmongUsDataService:
             npi_fields = npi_ptr + fields_off
             for offset in [0x38, 0x3C, 0x40, 0x44, 0x48] + list(range(0x30, 0x80, 8 if self.memory.is_64 else 4)):
                 try:
-                    outfits_dict = self.memory.read_ptr(npi_fields + offset)
+                    if blob:
+                        outfits_dict = self._blob_ptr(blob, offset)
+                    else:
+                        outfits_dict = self.memory.read_ptr(npi_fields + offset)
                     if not outfits_dict:
                         continue
                     dict_fields = outfits_dict + fields_off
@@ -785,7 +838,7 @@ class AmongUsDataService:
         except Exception:
             return []
 
-    def _get_player_control_from_npi(self, npi_ptr: int) -> int:
+    def _get_player_control_from_npi(self, npi_ptr: int, blob: Optional[bytes] = None) -> int:
         if not npi_ptr:
             return 0
         try:
@@ -794,7 +847,10 @@ class AmongUsDataService:
             pc_klass = self._get_class_from_typeinfo(Offsets.PC_TYPEINFO_RVA) or self._get_class_from_dotnet("playercontrol")
             for offset in [0x48, 0x4C, 0x50, 0x54, 0x58, 0x5C]:
                 try:
-                    candidate_pc = self.memory.read_ptr(npi_fields + offset)
+                    if blob:
+                        candidate_pc = self._blob_ptr(blob, offset)
+                    else:
+                        candidate_pc = self.memory.read_ptr(npi_fields + offset)
                     if candidate_pc:
                         candidate_klass = self.memory.read_ptr(candidate_pc)
                         if candidate_klass == pc_klass:
@@ -1186,13 +1242,14 @@ class AmongUsDataService:
             all_npi = self._get_all_npi_objects()
             for idx, npi in enumerate(all_npi):
                 try:
-                    player_control = self._get_player_control_from_npi(npi)
+                    blob = self._read_npi_fields(npi)
+                    player_control = self._get_player_control_from_npi(npi, blob)
                     if not player_control:
                         continue
                     position = self._get_player_position(player_control)
                     if not position:
                         continue
-                    color_id = self._get_player_color_id(npi)
+                    color_id = self._get_player_color_id(npi, blob)
                     if color_id < 0:
                         continue
                     fields_off = Offsets.OBJ_FIELDS_OFF_X64 if self.memory.is_64 else Offsets.OBJ_FIELDS_OFF_X86
@@ -1204,7 +1261,7 @@ class AmongUsDataService:
                     player_id = None
                     for offset in (0x8, 0x10, 0x18, 0x20, 0x24, 0x28, 0x2C, 0x30, 0x34, 0x38):
                         try:
-                            candidate_id = self.memory.read_u8(npi_fields + offset)
+                            candidate_id = blob[offset] if blob else self.memory.read_u8(npi_fields + offset)
                             # Check if it's a reasonable player_id (0-15 is typical for Among Us)
                             if 0 <= candidate_id < 16:
                                 # Verify it's not just a common value by checking uniqueness
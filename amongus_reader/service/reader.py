@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
-from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 from ..cache.manager import CacheManager
 from .data_service import AmongUsDataService, PlayerData, TaskData, ColorId
@@ -9,10 +8,12 @@ from ..readers.players import PlayersReader
 from ..readers.tasks import TasksReader
 from ..readers.hud import HudReader
 from ..readers.session import SessionReader
-from .task_lookup import TaskPanelEntry, format_task_entry
+from .task_lookup import TaskPanelEntry, format_task_entry, task_type_histograms
 
 
 class AmongUsReader:
+    __slots__ = ("_ds", "_players", "_tasks", "_hud", "_session", "_cache")
+
     def __init__(
         self,
         process_name: str = "Among Us.exe",
@@ -54,34 +55,29 @@ class AmongUsReader:
         self._ds.enable_debug(enabled)
 
     # Cache
+    _REFRESH_HANDLERS: Dict[str, Callable[["AmongUsReader"], None]] = {
+        "players": lambda self: self._cache.set("players", self._players.list_players()),
+        "colors": lambda self: self._cache.set("colors", self._players.colors()),
+        "hud": lambda self: self._cache.set("hud", self._hud.is_report_active(), subkey="report"),
+        # tasks are keyed per player; cannot bulk refresh safely -> fall back to lazy fetch
+        "tasks": lambda self: self._cache.invalidate(["tasks"]),
+        "local_role": lambda self: self._cache.set("local_role", self._ds.get_local_impostor_flag(), subkey="impostor"),
+        "session": lambda self: self._cache.set("session", self._session.state(), subkey="state"),
+    }
+
     def refresh(self, types: Optional[Iterable[str]] = None, force: bool = False) -> None:
         if not types:
             self._cache.invalidate(None)
             self._ds.refresh(force=force)
             return
+        if isinstance(types, str):
+            types = (types,)
         # Refresh only requested types; rely on DS to have latest when needed.
+        handlers = self._REFRESH_HANDLERS
         for t in types:
-            typ = str(t or "").strip().lower()
-            if typ == "players":
-                players = self._players.list_players()
-                self._cache.set("players", players)
-            elif typ == "colors":
-                colors = self._players.colors()
-                self._cache.set("colors", colors)
-            elif typ == "hud":
-                status = self._hud.is_report_active()
-                self._cache.set("hud", status, subkey="report")
-            elif typ == "tasks":
-                # tasks are keyed per player; cannot bulk refresh safely
-                self._cache.invalidate(["tasks"])  # fall back to lazy fetch
-            elif typ == "local_role":
-                result = self._ds.get_local_impostor_flag()
-                self._cache.set("local_role", result, subkey="impostor")
-            elif typ == "session":
-                state = self._session.state()
-                self._cache.set("session", state, subkey="state")
-            else:
-                pass
+            handler = handlers.get(str(t or "").strip().lower())
+            if handler is not None:
+                handler(self)
         if force:
             self._ds.refresh(force=True)
 
@@ -190,8 +186,7 @@ class AmongUsReader:
         tasks = self.get_tasks(color_id)
         if not tasks:
             return []
-        totals = Counter(t.task_type_id for t in tasks)
-        completed_counts = Counter(t.task_type_id for t in tasks if t.is_completed)
+        totals, completed_counts = task_type_histograms(tasks)
         panel: List[TaskPanelEntry] = []
         for task in tasks:
             if task.is_completed and not include_completed:
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
+import array
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple, TYPE_CHECKING
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Sequence, Tuple, Union, TYPE_CHECKING
 
-from collections import Counter
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
     from .data_service import TaskData
 
 
-TASK_TYPE_NAMES: Dict[int, str] = {
+def _freeze_table(obj):
+    """Read-only view of a lookup table, nested dicts included; the derived tables below assume it never changes."""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze_table(v) for k, v in obj.items()})
+    return obj
+
+
+TASK_TYPE_NAMES: Mapping[int, str] = _freeze_table({
     0x00: "Submit Scan",
     0x01: "Prime Shields",
     0x02: "Fuel Engines",
@@ -33,10 +42,10 @@ TASK_TYPE_NAMES: Dict[int, str] = {
     0x15: "Stabilize Steering",
     0x1C: "Run Diagnostics",
     0x3C: "Vent Cleaning"
-}
+})
 
 
-TASK_COORDS_SHIP: Dict[str, Dict[str, Tuple[float, float]]] = {
+TASK_COORDS_SHIP: Mapping[str, Mapping[str, Tuple[float, float]]] = _freeze_table({
     "Submit Scan": {"MedBay": (-7.19, -5.17)},
     "Prime Shields": {"Shields": (7.52, -14.48)},
     "Fuel Engines": {
@@ -89,33 +98,58 @@ TASK_COORDS_SHIP: Dict[str, Dict[str, Tuple[float, float]]] = {
     "Clean O2 Filter": {"Oxygen": (6.06, -3.31)},
     "Restore Oxygen": {"Oxygen": (6.75, -3.43)},
     "Stabilize Steering": {"Navigation": (17.60, -4.51)},
+})
+
+
+# Flat views of TASK_COORDS_SHIP: (task name, room) -> coord, and task name -> its first (room, coord)
+_TASK_COORDS_FLAT: Dict[Tuple[str, str], Tuple[float, float]] = {
+    (name, room): coord for name, rooms in TASK_COORDS_SHIP.items() for room, coord in rooms.items()
+}
+_TASK_FIRST_ROOM: Dict[str, Tuple[str, Tuple[float, float]]] = {
+    name: next(iter(rooms.items())) for name, rooms in TASK_COORDS_SHIP.items() if rooms
 }
 
 
-MULTISTEP_HINT: Dict[int, int] = {
+MULTISTEP_HINT: Mapping[int, int] = _freeze_table({
     0x02: 2,  # Fuel Engines
     0x06: 20,  # Clear Asteroids
     0x07: 2,  # Download/Upload Data
     0x0B: 2,  # Align Engine Output
     0x0C: 3,  # Fix Wiring
     0x0E: 2,  # Divert Power
-}
+})
 
 # Certain tasks expose step/max_step values that do not reflect the in-game panels.
 # Override their display totals / progress offsets to match what players expect.
-PROGRESS_OVERRIDES: Dict[int, Dict[str, int]] = {
+PROGRESS_OVERRIDES: Mapping[int, Mapping[str, int]] = _freeze_table({
     0x04: {"suppress_progress": True},
     0x0D: {"total": 1, "offset": -1, "apply_offset_with_step": True},  # Calibrate Distributor
     0x12: {"suppress_progress": True},
+})
+
+# PROGRESS_OVERRIDES pre-resolved per task type:
+# (suppress_progress, total or None, offset or None, apply_offset_with_step)
+_PROGRESS_RULES: Dict[int, Tuple[bool, Optional[int], Optional[int], bool]] = {
+    tid: (
+        bool(rule.get("suppress_progress")),
+        max(rule["total"], 1) if "total" in rule else None,
+        rule.get("offset"),
+        bool(rule.get("apply_offset_with_step")),
+    )
+    for tid, rule in PROGRESS_OVERRIDES.items()
+    if rule
 }
 
 
-ROOM_ALIASES: Dict[str, str] = {
+ROOM_ALIASES: Mapping[str, str] = _freeze_table({
     "O2": "Oxygen",
-}
+})
 
+# canonical room (lowercased) -> alias shown on the task panel
+_CANONICAL_TO_ALIAS: Dict[str, str] = {canonical.lower(): alias for alias, canonical in ROOM_ALIASES.items()}
 
-DIVERT_DEST_PRIORITY = [
+
+DIVERT_DEST_PRIORITY: Tuple[str, ...] = (
     "Weapons",
     "Navigation",
     "Shields",
@@ -124,10 +158,20 @@ DIVERT_DEST_PRIORITY = [
     "Lower Engine",
     "Oxygen",
     "Security",
-]
+)
+
+# Align Engine Output stage order, and the rooms where Download/Upload Data is on its upload step
+_ENGINE_STAGES: Tuple[str, ...] = ("Upper Engine", "Lower Engine")
+_UPLOAD_ROOMS = frozenset({"admin", "office"})
+_ELECTRICAL_LC = "electrical"
 
+# (candidate, canonical room) pairs for choose_divert_destination
+_DIVERT_PRIORITY_CANON: Tuple[Tuple[str, str], ...] = tuple(
+    (c, ROOM_ALIASES.get(c, c)) for c in DIVERT_DEST_PRIORITY if ROOM_ALIASES.get(c, c)
+)
 
-SYSTEM_TYPE_NAMES: Dict[int, str] = {
+
+SYSTEM_TYPE_NAMES: Mapping[int, str] = _freeze_table({
     0x00: "Hallway",
     0x01: "Storage",
     0x02: "Cafeteria",
@@ -185,62 +229,129 @@ SYSTEM_TYPE_NAMES: Dict[int, str] = {
     0x36: "Highlands",
     0x37: "Jungle",
     0x38: "Sleeping Quarters",
+})
+
+
+# Dense id -> name tables for the render path; "" marks ids with no name. The dicts above stay the source of truth.
+_TASK_TYPE_ARR: Tuple[str, ...] = tuple(TASK_TYPE_NAMES.get(i, "") for i in range(max(TASK_TYPE_NAMES) + 1))
+_SYSTEM_TYPE_ARR: Tuple[str, ...] = tuple(SYSTEM_TYPE_NAMES.get(i, "") for i in range(max(SYSTEM_TYPE_NAMES) + 1))
+
+# Every room label the tables above can produce, lowercased once at import
+_ROOM_KEYS: Dict[str, str] = {
+    room: room.lower()
+    for room in (
+        *SYSTEM_TYPE_NAMES.values(),
+        *(room for rooms in TASK_COORDS_SHIP.values() for room in rooms),
+        *ROOM_ALIASES,
+        *ROOM_ALIASES.values(),
+        *DIVERT_DEST_PRIORITY,
+    )
 }
 
+# Divert Power panel labels for every destination the game can report, keyed by the raw destination name
+_DIVERT_LABELS: Dict[str, str] = {
+    dest: f"Divert Power to {_CANONICAL_TO_ALIAS.get(dest.lower(), dest)}"
+    for dest in (*DIVERT_DEST_PRIORITY, *SYSTEM_TYPE_NAMES.values())
+}
+_ACCEPT_DIVERTED_LABEL = "Accept Diverted Power"
+
+
+# Dense per-task-type histograms: every known task_type_id fits below this bound.
+TASK_TYPE_HISTOGRAM_SIZE = 64
+
+TaskTypeCounts = Union[Mapping[int, int], Sequence[int]]
+
+
+def task_type_histograms(tasks: Sequence["TaskData"]) -> Tuple[TaskTypeCounts, TaskTypeCounts]:
+    """Return (totals, completed) counts indexed by task_type_id.
+
+    Uses flat ``array('i')`` histograms; falls back to plain dicts if an id is out of range.
+    """
+    size = TASK_TYPE_HISTOGRAM_SIZE
+    totals = array.array("i", bytes(4 * size))
+    completed = array.array("i", bytes(4 * size))
+    for t in tasks:
+        tid = t.task_type_id
+        if not (0 <= tid < size):
+            break
+        totals[tid] += 1
+        if t.is_completed:
+            completed[tid] += 1
+    else:
+        return totals, completed
+    totals_map: Dict[int, int] = {}
+    completed_map: Dict[int, int] = {}
+    for t in tasks:
+        tid = t.task_type_id
+        totals_map[tid] = totals_map.get(tid, 0) + 1
+        if t.is_completed:
+            completed_map[tid] = completed_map.get(tid, 0) + 1
+    return totals_map, completed_map
+
+
+def _count_for(counts: TaskTypeCounts, task_type_id: int, default: int) -> int:
+    if isinstance(counts, Mapping):
+        return counts.get(task_type_id, default)
+    if 0 <= task_type_id < len(counts):
+        return counts[task_type_id]
+    return default
+
 
 def task_type_name(task_type_id: int) -> str:
-    return TASK_TYPE_NAMES.get(int(task_type_id), f"TaskType#{task_type_id}")
+    # TaskData ids are coerced to int where they are read from memory, so no int() here
+    name = _TASK_TYPE_ARR[task_type_id] if 0 <= task_type_id < len(_TASK_TYPE_ARR) else ""
+    return name or f"TaskType#{task_type_id}"
 
 
 def normalize_room_label(room: Optional[str]) -> Optional[str]:
     if room is None:
         return None
-    canonical = ROOM_ALIASES.get(room)
-    if canonical:
-        return canonical
-    return room
+    return ROOM_ALIASES.get(room, room)
+
+
+def _room_key(room: str) -> str:
+    return _ROOM_KEYS.get(room) or room.lower()
 
 
 def display_room(room: Optional[str]) -> str:
     if not room:
         return "Unknown"
-    for alias, canonical in ROOM_ALIASES.items():
-        if canonical.lower() == room.lower():
-            return alias
-    return room
+    return _CANONICAL_TO_ALIAS.get(_room_key(room), room)
 
 
+# Results are immutable tuples. Room labels can come from game memory, so keep the cache bounded.
+@lru_cache(maxsize=256)
 def resolve_task_location(
     task_type_id: int,
     preferred_room: Optional[str] = None,
 ) -> Tuple[str, str, Optional[Tuple[float, float]]]:
     name = task_type_name(task_type_id)
-    room_map = TASK_COORDS_SHIP.get(name, {})
-    if not room_map:
+    first = _TASK_FIRST_ROOM.get(name)
+    if first is None:
         return name, "Unknown", None
     canonical_pref = normalize_room_label(preferred_room)
-    if canonical_pref and canonical_pref in room_map:
-        return name, canonical_pref, room_map[canonical_pref]
-    first_room, coord = next(iter(room_map.items()))
-    return name, first_room, coord
+    if canonical_pref:
+        coord = _TASK_COORDS_FLAT.get((name, canonical_pref))
+        if coord is not None:
+            return name, canonical_pref, coord
+    return name, first[0], first[1]
 
 
 def system_type_to_name(system_id: Optional[int]) -> Optional[str]:
     if system_id is None:
         return None
-    return SYSTEM_TYPE_NAMES.get(int(system_id))
+    return (_SYSTEM_TYPE_ARR[system_id] if 0 <= system_id < len(_SYSTEM_TYPE_ARR) else "") or None
 
 
 def choose_divert_destination(current_room: Optional[str]) -> Optional[str]:
     canonical_current = normalize_room_label(current_room)
-    for candidate in DIVERT_DEST_PRIORITY:
-        candidate_canonical = normalize_room_label(candidate)
-        if candidate_canonical and candidate_canonical != canonical_current:
+    for candidate, candidate_canonical in _DIVERT_PRIORITY_CANON:
+        if candidate_canonical != canonical_current:
             return candidate
     return None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TaskPanelEntry:
     room: str
     task_name: str
@@ -257,84 +368,94 @@ class TaskPanelEntry:
         return ""
 
     def display_text(self) -> str:
-        suffix = self.progress_suffix()
-        if suffix:
-            return f"{self.room}: {self.task_name} {suffix}"
+        total = self.total_steps
+        if total and total > 1:
+            return f"{self.room}: {self.task_name} ({self.completed_steps or 0}/{total})"
         return f"{self.room}: {self.task_name}"
 
 
 def format_task_entry(
     task: "TaskData",
-    totals: Counter,
-    completed_counts: Counter,
+    totals: TaskTypeCounts,
+    completed_counts: TaskTypeCounts,
+) -> TaskPanelEntry:
+    # Read each TaskData field once; the histogram counts only matter without step data
+    tid = task.task_type_id
+    step = task.step
+    max_step = task.max_step
+    if step is not None and max_step is not None:
+        total_count = completed_count = None
+    else:
+        total_count = _count_for(totals, tid, 1)
+        completed_count = _count_for(completed_counts, tid, 0)
+    return _format_entry(
+        task.task_id, tid, step, max_step, task.location, task.destination, total_count, completed_count
+    )
+
+
+# Panels are polled far more often than tasks change; the key covers every input the
+# entry depends on, so a hit is always current and no explicit invalidation is needed.
+@lru_cache(maxsize=512)
+def _format_entry(
+    task_id: int,
+    tid: int,
+    step: Optional[int],
+    max_step: Optional[int],
+    location: Optional[str],
+    dest_val: Optional[Union[str, int]],
+    total_count: Optional[int],
+    completed_count: Optional[int],
 ) -> TaskPanelEntry:
-    base_name = task_type_name(task.task_type_id)
-    resolved_name, canonical_room, coord = resolve_task_location(task.task_type_id, task.location)
-    room_canonical = canonical_room
-    preferred = normalize_room_label(task.location)
+    # coord is None only when the task type has no coordinate table, so one lookup settles it
+    name_display, room_canonical, coord = resolve_task_location(tid, location)
+    preferred = normalize_room_label(location)
     if preferred:
+        # The reported room wins for display even when it has no coordinates of its own
         room_canonical = preferred
-        if coord is None:
-            # try lookup with canonical preferred room
-            _, _, coord_pref = resolve_task_location(task.task_type_id, preferred)
-            coord = coord_pref
-    elif task.location:
-        # If custom label provided but no mapping, keep as-is for display
-        room_canonical = task.location
-
-    if coord is None:
-        # best-effort fallback
-        _, _, coord = resolve_task_location(task.task_type_id)
-
-    using_step = task.step is not None and task.max_step is not None
+
+    using_step = total_count is None
     if using_step:
-        completed_steps = int(task.step)
-        total_steps = max(int(task.max_step), 1)
+        completed_steps = step
+        total_steps = max(max_step, 1)
     else:
-        total_steps = totals.get(task.task_type_id, 1)
-        if total_steps <= 1 and task.task_type_id in MULTISTEP_HINT:
-            total_steps = MULTISTEP_HINT[task.task_type_id]
-        completed_steps = completed_counts.get(task.task_type_id, 0)
-
-    override = PROGRESS_OVERRIDES.get(task.task_type_id)
-    if override:
-        if override.get("suppress_progress"):
+        total_steps = total_count
+        if total_steps <= 1:
+            total_steps = MULTISTEP_HINT.get(tid, total_steps)
+        completed_steps = completed_count
+
+    rule = _PROGRESS_RULES.get(tid)
+    if rule is not None:
+        suppress, rule_total, offset, offset_with_step = rule
+        if suppress:
             completed_steps = None
             total_steps = None
         else:
-            if "total" in override:
-                total_steps = max(override["total"], 1)
-            offset = override.get("offset")
-            if offset is not None:
-                if using_step:
-                    if override.get("apply_offset_with_step"):
-                        completed_steps += offset
-                else:
-                    completed_steps += offset
+            if rule_total is not None:
+                total_steps = rule_total
+            if offset is not None and (offset_with_step or not using_step):
+                completed_steps += offset
             completed_steps = max(0, min(completed_steps, total_steps))
 
-    canonical_room_norm = normalize_room_label(room_canonical) if room_canonical else None
+    # room_canonical is already normalized (or a coordinate-table key)
+    canonical_room_norm = room_canonical or None
 
     # Align Engine Output: progress determined by location order (Upper -> Lower)
-    if task.task_type_id == 0x0B:
-        stages = ["Upper Engine", "Lower Engine"]
-        if canonical_room_norm in stages:
-            total_steps = len(stages)
-            completed_steps = stages.index(canonical_room_norm)
+    if tid == 0x0B:
+        if canonical_room_norm in _ENGINE_STAGES:
+            total_steps = len(_ENGINE_STAGES)
+            completed_steps = _ENGINE_STAGES.index(canonical_room_norm)
 
     # Download / Upload Data: stage depends on current room (Admin/Office implies upload)
-    if task.task_type_id == 0x07:
+    if tid == 0x07:
         total_steps = 2
-        if canonical_room_norm and canonical_room_norm.lower() in {"admin", "office"}:
+        if canonical_room_norm and _room_key(canonical_room_norm) in _UPLOAD_ROOMS:
             completed_steps = 1
         else:
             completed_steps = 0
 
     room_display = display_room(room_canonical)
-    name_display = base_name if base_name != resolved_name else resolved_name
 
-    if task.task_type_id == 0x0E:  # Divert Power stages
-        dest_val = task.destination
+    if tid == 0x0E:  # Divert Power stages
         if isinstance(dest_val, str) and dest_val:
             dest_name = dest_val
         elif dest_val is not None:
@@ -342,23 +463,24 @@ def format_task_entry(
         else:
             dest_name = None
 
-        if not dest_name and room_canonical and room_canonical.lower() == "electrical":
+        in_electrical = bool(room_canonical) and _room_key(room_canonical) == _ELECTRICAL_LC
+        if not dest_name and in_electrical:
             dest_name = choose_divert_destination(room_canonical)
 
         if dest_name:
-            dest_display = display_room(dest_name)
-            name_display = f"Divert Power to {dest_display}"
-        elif room_canonical and room_canonical.lower() != "electrical":
-            name_display = "Accept Diverted Power"
+            name_display = _DIVERT_LABELS.get(dest_name) or f"Divert Power to {display_room(dest_name)}"
+        elif room_canonical and not in_electrical:
+            name_display = _ACCEPT_DIVERTED_LABEL
 
     entry = TaskPanelEntry(
         room=room_display,
         task_name=name_display,
         completed_steps=completed_steps,
         total_steps=total_steps,
-        task_id=int(task.task_id),
-        task_type_id=int(task.task_type_id),
+        task_id=task_id,
+        task_type_id=tid,
         coordinates=coord,
         canonical_room=room_canonical,
     )
-    return entry
\ No newline at end of file
+    return entry
+
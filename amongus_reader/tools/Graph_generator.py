@@ -5,12 +5,18 @@ import json
 import pickle
 import shutil
 from datetime import datetime
-from typing import List, Tuple, Optional, Set
+from typing import Dict, List, Tuple, Optional, Set
 
 import networkx as nx
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.collections import LineCollection
 
+try:
+    import zstandard
+except ImportError:  # zstandard is optional; sessions are then written as plain G.pkl
+    zstandard = None
+
 import sys
 import atexit
 ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -18,12 +24,15 @@ if ROOT_DIR not in sys.path:
     sys.path.insert(0, ROOT_DIR)
 
 from amongus_reader.service import AmongUsReader
+from _graph_kernels import nearest_within as _nearest_within, within as _within
+from _timing import sleep_until
 
 BASE_DIR = os.path.dirname(__file__)
 GENERATED_ROOT = os.path.join(BASE_DIR, "graphs_generated")
 PUBLISHED_DIR = os.path.join(BASE_DIR, "graphs")
 
 _READER: Optional[AmongUsReader] = None
+_LOCAL_COLOR_ID: Optional[int] = None
 
 
 def _get_reader() -> AmongUsReader:
@@ -60,21 +69,41 @@ def _get_map_name(default: str) -> str:
 
 
 def _get_player_position() -> Optional[Tuple[float, float]]:
+    global _LOCAL_COLOR_ID
     reader = _get_reader()
     try:
-        local_player = reader.get_local_player()
-        local_id = local_player.color_id if local_player else None
+        # The local colour is fixed for a recording; only look it up again once positions() stops reporting it
+        local_id = _LOCAL_COLOR_ID
         if local_id is None:
-            return None
-        pos_map = reader.positions()
-        pos = pos_map.get(local_id)
+            local_player = reader.get_local_player()
+            local_id = local_player.color_id if local_player else None
+            if local_id is None:
+                return None
+            _LOCAL_COLOR_ID = local_id
+        pos = reader.positions().get(local_id)
         if not pos:
+            _LOCAL_COLOR_ID = None
             return None
         return (float(pos[0]), float(pos[1]))
     except Exception:
+        _LOCAL_COLOR_ID = None
         return None
 
 
+def _ensure_capacity(arr: np.ndarray, n: int) -> np.ndarray:
+    """Return arr, or a copy with doubled length, so that row n can be written."""
+    if n < len(arr):
+        return arr
+    grown = np.empty((2 * len(arr),) + arr.shape[1:], dtype=arr.dtype)
+    grown[:n] = arr[:n]
+    return grown
+
+
+# Undirected edge (a, b) with a < b packed into one int key: a in the high 32 bits, b in the low
+_EDGE_SHIFT = 32
+_EDGE_MASK = (1 << _EDGE_SHIFT) - 1
+
+
 class GraphRecorder:
     def __init__(
         self,
@@ -93,20 +122,38 @@ class GraphRecorder:
         self.merge_radius = float(merge_radius)
         self.visualize = bool(visualize)
         self.viz_scale = float(viz_scale)
+        # Squared so the per-sample anchor check needs no sqrt
+        self._spacing2 = self.node_spacing * self.node_spacing
 
         self.nodes: List[Tuple[float, float]] = []
-        self.edges: Set[Tuple[int, int]] = set()
+        # self.nodes mirrored into a (capacity, 2) array for vectorized neighbour queries; grows by doubling
+        self._nodes_arr = np.empty((64, 2), dtype=np.float64)
+        # Uniform grid hash over node indices; with the cell at least as large as every query
+        # radius, a neighbour query only has to look at the 3x3 cells around the position.
+        self._cell = max(self.node_spacing, self.connect_threshold, self.merge_radius, 1e-3)
+        self._grid: Dict[Tuple[int, int], List[int]] = {}
+        # Packed edge keys (see _EDGE_SHIFT); one int per edge instead of a tuple
+        self.edges: Set[int] = set()
+        # Plot-space (viz_scale applied) node offsets and edge segments, projected once as the
+        # graph grows; nodes never move, so redraws just hand the filled prefixes to matplotlib.
+        self._plot_nodes = np.empty((64, 2), dtype=np.float64)
+        self._plot_segs = np.empty((64, 2, 2), dtype=np.float64)
+        self._n_segs = 0
 
         self._anchor_idx: Optional[int] = None
         self._last_pos: Optional[Tuple[float, float]] = None
         self._stopped = False
         self._save_on_exit = True
+        # Set by the 'p' hotkey; run() publishes once per tick however many presses arrived
+        self._publish_requested = False
 
         self._fig = None
         self._ax = None
         self._sc_nodes = None
         self._sc_player = None
         self._lc_edges = None
+        # Set when nodes or edges change; the plot re-uploads the graph artists only then
+        self._plot_dirty = True
 
     # --------- Visualization helpers ---------
     def _init_plot(self):
@@ -130,68 +177,97 @@ class GraphRecorder:
             self._save_on_exit = False
             self._stopped = True
         elif event.key == 'p':
-            try:
-                session_dir = self.save_session()
-                publish_graph(self.map_name, session_dir)
-                print(f"Published to {os.path.join(PUBLISHED_DIR, f'{self.map_name}_G.pkl')}")
-            except Exception as e:
-                print(f"Publish failed: {e}")
+            self._publish_requested = True
+
+    def _publish_pending(self):
+        if not self._publish_requested:
+            return
+        self._publish_requested = False
+        try:
+            session_dir = self.save_session()
+            print(f"Published to {publish_graph(self.map_name, session_dir)}")
+        except Exception as e:
+            print(f"Publish failed: {e}")
 
     def _update_plot(self, player_pos: Optional[Tuple[float, float]]):
         if not self.visualize:
             return
         s = self.viz_scale
-        xs = [p[0] * s for p in self.nodes]
-        ys = [p[1] * s for p in self.nodes]
-        self._sc_nodes.set_offsets(list(zip(xs, ys)) if xs else [])
+        if self._plot_dirty:
+            # Most samples add nothing (player idle or within node_spacing), so skip the rebuild then
+            self._sc_nodes.set_offsets(self._plot_nodes[:len(self.nodes)])
+            self._lc_edges.set_segments(self._plot_segs[:self._n_segs])
+            self._plot_dirty = False
         sp = None
         if player_pos is not None:
             sp = (player_pos[0] * s, player_pos[1] * s)
             self._sc_player.set_offsets([sp])
-        # edges
-        segments = []
-        for a, b in self.edges:
-            pa = self.nodes[a]
-            pb = self.nodes[b]
-            segments.append([(pa[0] * s, pa[1] * s), (pb[0] * s, pb[1] * s)])
-        self._lc_edges.set_segments(segments)
         # optional auto-limits: keep current if many points
         if sp is not None and len(self.nodes) < 50:
             r = 5 * s
             self._ax.set_xlim(sp[0] - r, sp[0] + r)
             self._ax.set_ylim(sp[1] - r, sp[1] + r)
-        self._fig.canvas.draw_idle()
-        plt.pause(0.001)
+        # One redraw request plus one pass over pending GUI events (key presses); plt.pause
+        # would also re-request the draw, call show() and spin a timed event loop each sample.
+        canvas = self._fig.canvas
+        canvas.draw_idle()
+        canvas.flush_events()
 
     # --------- Graph building logic ---------
+    def _cell_of(self, pos: Tuple[float, float]) -> Tuple[int, int]:
+        return (math.floor(pos[0] / self._cell), math.floor(pos[1] / self._cell))
+
+    def _candidates(self, pos: Tuple[float, float], radius: float) -> np.ndarray:
+        """Sorted indices of the nodes in grid cells that can hold a point within radius of pos."""
+        cx, cy = self._cell_of(pos)
+        reach = max(1, math.ceil(radius / self._cell))
+        grid = self._grid
+        out: List[int] = []
+        for gx in range(cx - reach, cx + reach + 1):
+            for gy in range(cy - reach, cy + reach + 1):
+                bucket = grid.get((gx, gy))
+                if bucket:
+                    out.extend(bucket)
+        out.sort()
+        return np.asarray(out, dtype=np.intp)
+
     def _find_nearby_node(self, pos: Tuple[float, float], radius: float) -> Optional[int]:
-        r2 = radius * radius
-        best_idx = None
-        best_d2 = None
-        for i, p in enumerate(self.nodes):
-            dx = p[0] - pos[0]
-            dy = p[1] - pos[1]
-            d2 = dx * dx + dy * dy
-            if d2 <= r2 and (best_d2 is None or d2 < best_d2):
-                best_idx, best_d2 = i, d2
-        return best_idx
+        cand = self._candidates(pos, radius)
+        idx = int(_nearest_within(self._nodes_arr, cand, float(pos[0]), float(pos[1]), radius * radius))
+        return idx if idx >= 0 else None
 
     def _add_node(self, pos: Tuple[float, float]) -> int:
+        n = len(self.nodes)
+        self._nodes_arr = _ensure_capacity(self._nodes_arr, n)
+        self._nodes_arr[n] = pos
+        if self.visualize:
+            self._plot_nodes = _ensure_capacity(self._plot_nodes, n)
+            self._plot_nodes[n] = self._nodes_arr[n] * self.viz_scale
         self.nodes.append(pos)
-        return len(self.nodes) - 1
+        self._grid.setdefault(self._cell_of(pos), []).append(n)
+        self._plot_dirty = True
+        return n
 
     def _connect(self, i: int, j: int):
         if i == j:
             return
         a, b = (i, j) if i < j else (j, i)
-        self.edges.add((a, b))
+        key = (a << _EDGE_SHIFT) | b
+        if key not in self.edges:
+            self.edges.add(key)
+            if self.visualize:
+                k = self._n_segs
+                self._plot_segs = _ensure_capacity(self._plot_segs, k)
+                self._plot_segs[k, 0] = self._plot_nodes[a]
+                self._plot_segs[k, 1] = self._plot_nodes[b]
+                self._n_segs = k + 1
+            self._plot_dirty = True
 
     def _connect_nearby(self, idx: int, radius: float):
         p = self.nodes[idx]
-        for j, q in enumerate(self.nodes):
-            if j == idx:
-                continue
-            if math.dist(p, q) <= radius:
+        cand = self._candidates(p, radius)
+        for j in _within(self._nodes_arr, cand, float(p[0]), float(p[1]), radius * radius).tolist():
+            if j != idx:
                 self._connect(idx, j)
 
     def _maybe_create_node(self, pos: Tuple[float, float]):
@@ -199,8 +275,10 @@ class GraphRecorder:
         if self._anchor_idx is None:
             self._anchor_idx = self._add_node(pos)
             return
-        anchor_pos = self.nodes[self._anchor_idx]
-        if math.dist(pos, anchor_pos) < self.node_spacing:
+        ax, ay = self.nodes[self._anchor_idx]
+        dx = pos[0] - ax
+        dy = pos[1] - ay
+        if dx * dx + dy * dy < self._spacing2:
             return
         # merge to nearby node if any
         idx = self._find_nearby_node(pos, self.merge_radius)
@@ -216,16 +294,20 @@ class GraphRecorder:
     # --------- Session control ---------
     def run(self, max_seconds: Optional[float] = None) -> str:
         self._init_plot()
-        start = time.time()
+        start = time.monotonic()
+        # Sample on a fixed schedule: the reader and plot time come out of the interval
+        # instead of being added on top of it.
+        next_sample = time.perf_counter() + self.interval
         try:
             while not self._stopped:
                 pos = _get_player_position()
                 if pos is not None:
                     self._maybe_create_node(pos)
                 self._update_plot(pos)
-                if max_seconds is not None and (time.time() - start) >= max_seconds:
+                self._publish_pending()
+                if max_seconds is not None and (time.monotonic() - start) >= max_seconds:
                     break
-                time.sleep(self.interval)
+                next_sample = sleep_until(next_sample, self.interval)
         finally:
             if self.visualize and self._fig is not None:
                 plt.ioff()
@@ -247,15 +329,23 @@ class GraphRecorder:
 
         # Build NetworkX graph
         G = nx.Graph()
-        for i, p in enumerate(self.nodes):
-            G.add_node(i, pos=(float(p[0]), float(p[1])))
-        for a, b in self.edges:
-            pa = self.nodes[a]
-            pb = self.nodes[b]
-            G.add_edge(a, b, weight=round(math.dist(pa, pb), 4))
-
-        with open(os.path.join(session_dir, 'G.pkl'), 'wb') as f:
-            pickle.dump(G, f)
+        G.add_nodes_from((i, {'pos': (float(p[0]), float(p[1]))}) for i, p in enumerate(self.nodes))
+        # Unpack every edge key and compute all weights in one NumPy pass
+        keys = np.fromiter(self.edges, dtype=np.int64, count=len(self.edges))
+        src = keys >> _EDGE_SHIFT
+        dst = keys & _EDGE_MASK
+        delta = self._nodes_arr[src] - self._nodes_arr[dst]
+        weights = np.hypot(delta[:, 0], delta[:, 1]).round(4)
+        G.add_weighted_edges_from(zip(src.tolist(), dst.tolist(), weights.tolist()))
+
+        data = pickle.dumps(G, protocol=pickle.HIGHEST_PROTOCOL)
+        graph_name = 'G.pkl'
+        if zstandard is not None:
+            # Compressed graphs get their own name so plain pickle readers never see a zstd frame
+            data = zstandard.ZstdCompressor(level=3, threads=-1).compress(data)
+            graph_name = 'G.pkl.zst'
+        with open(os.path.join(session_dir, graph_name), 'wb') as f:
+            f.write(data)
 
         meta = {
             'map': self.map_name,
@@ -274,13 +364,24 @@ class GraphRecorder:
 
 
 def publish_graph(map_name: str, session_dir: str) -> str:
-    """Copy session G.pkl to graphs/<MAP>_G.pkl for consumption by move.py"""
-    src = os.path.join(session_dir, 'G.pkl')
-    if not os.path.exists(src):
+    """Copy session G.pkl(.zst) to graphs/<MAP>_G.pkl(.zst) for consumption by move.py"""
+    for ext in ('.pkl.zst', '.pkl'):
+        src = os.path.join(session_dir, f'G{ext}')
+        if os.path.exists(src):
+            break
+    else:
         raise FileNotFoundError(f"G.pkl not found in {session_dir}")
     os.makedirs(PUBLISHED_DIR, exist_ok=True)
-    dst = os.path.join(PUBLISHED_DIR, f"{map_name}_G.pkl")
+    dst = os.path.join(PUBLISHED_DIR, f"{map_name}_G{ext}")
     shutil.copy2(src, dst)
+    # Drop the other format's copy and move.py's caches derived from the previous graph;
+    # they are rebuilt on next load.
+    stale = ("_G.pkl" if ext == '.pkl.zst' else "_G.pkl.zst", "_G.npz", "_apsp.npz")
+    for suffix in stale:
+        try:
+            os.remove(os.path.join(PUBLISHED_DIR, f"{map_name}{suffix}"))
+        except FileNotFoundError:
+            pass
     return dst
 
 
@@ -0,0 +1,68 @@
+"""Hot-loop kernels for Graph_generator.py's neighbour queries.
+
+Both take the recorder's node array plus the candidate indices from its grid hash.
+With numba installed they are compiled loops over just those candidates; without
+it the same functions fall back to NumPy.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+HAVE_NUMBA = njit is not None
+
+
+def _nearest_within_py(pts: np.ndarray, idx: np.ndarray, px: float, py: float, r2: float) -> int:
+    if not len(idx):
+        return -1
+    diff = pts[idx] - np.array((px, py), dtype=pts.dtype)
+    d2 = np.einsum('ij,ij->i', diff, diff)
+    k = int(d2.argmin())
+    return int(idx[k]) if d2[k] <= r2 else -1
+
+
+def _within_py(pts: np.ndarray, idx: np.ndarray, px: float, py: float, r2: float) -> np.ndarray:
+    diff = pts[idx] - np.array((px, py), dtype=pts.dtype)
+    return idx[np.einsum('ij,ij->i', diff, diff) <= r2]
+
+
+if HAVE_NUMBA:
+    @njit(cache=True)
+    def nearest_within(pts, idx, px, py, r2):
+        # First index wins ties, matching argmin over idx in ascending order.
+        best = -1
+        best_d = r2
+        for k in range(idx.shape[0]):
+            i = idx[k]
+            dx = pts[i, 0] - px
+            dy = pts[i, 1] - py
+            d = dx * dx + dy * dy
+            if d < best_d or (best < 0 and d <= best_d):
+                best_d = d
+                best = i
+        return best
+
+    @njit(cache=True)
+    def within(pts, idx, px, py, r2):
+        out = np.empty(idx.shape[0], dtype=idx.dtype)
+        n = 0
+        for k in range(idx.shape[0]):
+            i = idx[k]
+            dx = pts[i, 0] - px
+            dy = pts[i, 1] - py
+            if dx * dx + dy * dy <= r2:
+                out[n] = i
+                n += 1
+        return out[:n]
+
+    # Compile (or load from the on-disk cache) now rather than on the first recorded sample.
+    _warm = np.zeros((2, 2), dtype=np.float64)
+    nearest_within(_warm, np.zeros(1, dtype=np.intp), 0.0, 0.0, 1.0)
+    within(_warm, np.zeros(1, dtype=np.intp), 0.0, 0.0, 1.0)
+    del _warm
+else:
+    nearest_within = _nearest_within_py
+    within = _within_py
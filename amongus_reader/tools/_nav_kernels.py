@@ -0,0 +1,78 @@
+"""Hot-loop kernels for move.py's NavGraph.
+
+With numba installed these are compiled loops that allocate nothing per call;
+without it the same functions fall back to NumPy / plain Python.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+HAVE_NUMBA = njit is not None
+
+
+def _nearest_py(pts: np.ndarray, px: float, py: float) -> int:
+    diff = pts - np.array((px, py), dtype=pts.dtype)
+    return int(np.einsum('ij,ij->i', diff, diff).argmin())
+
+
+def _reconstruct_py(row: np.ndarray, s_idx: int, t_idx: int) -> np.ndarray:
+    out = [t_idx]
+    cur = t_idx
+    while cur != s_idx:
+        cur = int(row[cur])
+        if cur < 0:
+            return np.empty(0, dtype=np.int32)
+        out.append(cur)
+    out.reverse()
+    return np.asarray(out, dtype=np.int32)
+
+
+if HAVE_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def nearest(pts, px, py):
+        best = 0
+        best_d = np.inf
+        for i in range(pts.shape[0]):
+            dx = pts[i, 0] - px
+            dy = pts[i, 1] - py
+            d = dx * dx + dy * dy
+            if d < best_d:
+                best_d = d
+                best = i
+        return best
+
+    @njit(cache=True)
+    def reconstruct(row, s_idx, t_idx):
+        # Count hops first so the result is allocated once, then fill it backwards.
+        n = 1
+        cur = t_idx
+        while cur != s_idx:
+            cur = row[cur]
+            if cur < 0 or n > row.shape[0]:
+                return np.empty(0, dtype=np.int32)
+            n += 1
+        out = np.empty(n, dtype=np.int32)
+        cur = t_idx
+        for i in range(n - 1, -1, -1):
+            out[i] = cur
+            cur = row[cur]
+        return out
+
+    # Compile (or load from the on-disk cache) now rather than on the first movement tick.
+    nearest(np.zeros((2, 2), dtype=np.float64), 0.0, 0.0)
+    reconstruct(np.array([-1, 0], dtype=np.int32), 0, 1)
+else:
+    nearest = _nearest_py
+    reconstruct = _reconstruct_py
+
+
+def reconstruct_list(row: np.ndarray, s_idx: int, t_idx: int) -> Optional[list]:
+    """Node indices from s to t along a predecessor row, or None if t is unreachable."""
+    out = reconstruct(row, s_idx, t_idx)
+    return out.tolist() if len(out) else None
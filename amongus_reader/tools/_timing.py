@@ -0,0 +1,21 @@
+"""Fixed-rate loop pacing shared by the polling and movement tools.
+
+Loops keep an absolute deadline instead of sleeping a fixed amount after each
+iteration, so the time spent doing work comes out of the period rather than
+being added on top of it.
+"""
+
+import time
+
+
+def sleep_until(deadline: float, period: float) -> float:
+    """Sleep until deadline (perf_counter) and return the next iteration's deadline.
+
+    If the loop is already behind, skip the sleep and resync from now instead of
+    bursting to catch up.
+    """
+    remaining = deadline - time.perf_counter()
+    if remaining > 0:
+        time.sleep(remaining)
+        return deadline + period
+    return time.perf_counter() + period
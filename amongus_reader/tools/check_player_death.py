@@ -34,10 +34,11 @@ color_id 기반으로 플레이어를 찾고, 여러 방법을 시도하여 사
 
 from __future__ import annotations
 
+import struct
 import sys
 import time
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
@@ -46,6 +47,7 @@ if str(ROOT_DIR) not in sys.path:
 from amongus_reader.service import AmongUsReader
 from amongus_reader.service.data_service import AmongUsDataService, PlayerData
 from amongus_reader.core import Offsets
+from amongus_reader.tools._timing import sleep_until
 
 
 # Role type metadata (extracted from Il2Cpp enum definitions)
@@ -65,20 +67,58 @@ ROLE_TYPE_NAMES: Dict[int, str] = {
     0x0012: "Viper",
 }
 
+# RoleType 값은 0x00~0x1F의 조밀한 범위이므로 튜플 인덱싱으로 이름을 찾는다.
+_ROLE_TYPE_NAMES_TUPLE: Tuple[Optional[str], ...] = tuple(ROLE_TYPE_NAMES.get(i) for i in range(0x20))
+
+
+def _role_name(value: int) -> Optional[str]:
+    return _ROLE_TYPE_NAMES_TUPLE[value] if 0 <= value < 0x20 else None
+
+
 # Known value ranges for role types (allow room for newer roles)
 ROLE_TYPE_KNOWN_VALUES = set(ROLE_TYPE_NAMES.keys()) | set(range(0, 0x20))
 ROLE_TYPE_DEAD_VALUES = {0x0004, 0x0006, 0x0007}
 ROLE_TYPE_IMPOSTOR_VALUES = {0x0001, 0x0005, 0x0007}
 
-# Offset caches (per architecture) to avoid repeated scans
-_ROLE_OFFSET_CACHE: Dict[bool, Optional[int]] = {}
+# Offset caches (per architecture/process) to avoid repeated scans.
+# 재연결 시 다른 프로세스라면 자동으로 다시 탐색하도록 (is64, pid)로 구분한다.
+_ROLE_OFFSET_CACHE: Dict[Tuple[bool, int], Optional[int]] = {}
+
+# RoleType 값 캐시 ((pid, role_offset, color_id) -> (읽은 시각, 값)). 역할은 거의 바뀌지
+# 않으므로 한 폴링 주기 안에서는 재사용한다. 오프셋 캐시가 바뀌면 함께 비운다.
+_ROLE_VALUES_CACHE: Dict[Tuple[int, int, int], Tuple[float, int]] = {}
+_ROLE_TTL = 0.4
+
+# main() 출력용 템플릿 (루프마다 재구성하지 않도록 미리 만든다)
+_ROW_FMT = "{:<8} | {:<8} | {:<12} | {:<10} | {}".format
+_HEADER = _ROW_FMT("ColorID", "PlayerID", "Color Name", "Status", "Local")
+_SEP = "-" * 60
+
+# main() 폴링 주기 (초)
+_POLL_INTERVAL = 1.0
+
+
+_U16 = struct.Struct("<H").unpack_from
+
+# RoleType 후보 오프셋 탐색 구간 (2바이트 enum)
+_ROLE_SEARCH_END = 0x80
+
+
+def _process_id(ds: AmongUsDataService) -> int:
+    return int(getattr(ds.memory.pm, "process_id", 0) or 0)
+
+
+def _store_role_offset(key: Tuple[bool, int], offset: Optional[int]) -> None:
+    """오프셋 캐시를 갱신하고, 값이 바뀌었다면 RoleType 값 캐시를 비운다."""
+    if key in _ROLE_OFFSET_CACHE and _ROLE_OFFSET_CACHE[key] == offset:
+        return
+    _ROLE_OFFSET_CACHE[key] = offset
+    _ROLE_VALUES_CACHE.clear()
 
 
 def _read_u16(ds: AmongUsDataService, addr: int) -> int:
     """MemoryClient helper: 읽기 전용 16비트 값."""
-    lo = ds.memory.read_u8(addr)
-    hi = ds.memory.read_u8(addr + 1)
-    return lo | (hi << 8)
+    return _U16(ds.memory.read_bytes(addr, 2))[0]
 
 
 def _detect_role_offset(
@@ -89,19 +129,35 @@ def _detect_role_offset(
     """NetworkedPlayerInfo RoleType 필드 오프셋을 동적으로 식별합니다."""
     if not npi_map:
         return None
-    key = bool(ds.memory.is_64)
+    is64 = bool(ds.memory.is_64)
+    key = (is64, _process_id(ds))
     cached = _ROLE_OFFSET_CACHE.get(key)
     if cached is not None:
         return cached
 
+    # NPI마다 필드 구간을 한 번에 읽어 두고 후보 오프셋은 버퍼에서 디코딩한다.
+    blocks: Optional[Dict[int, bytes]] = {}
+    try:
+        for cid, npi in npi_map.items():
+            blocks[cid] = ds.memory.read_bytes(npi + fields_off, _ROLE_SEARCH_END)
+    except Exception:
+        blocks = None
+
     def validate_candidate(offset: int) -> bool:
         try:
             values = []
-            for npi in npi_map.values():
-                val = _read_u16(ds, npi + fields_off + offset)
-                if val not in ROLE_TYPE_KNOWN_VALUES:
-                    return False
-                values.append(val)
+            if blocks is not None:
+                for buf in blocks.values():
+                    val = _U16(buf, offset)[0]
+                    if val not in ROLE_TYPE_KNOWN_VALUES:
+                        return False
+                    values.append(val)
+            else:
+                for npi in npi_map.values():
+                    val = _read_u16(ds, npi + fields_off + offset)
+                    if val not in ROLE_TYPE_KNOWN_VALUES:
+                        return False
+                    values.append(val)
         except Exception:
             return False
 
@@ -115,31 +171,66 @@ def _detect_role_offset(
         return True
 
     # 64비트에서는 구조가 비교적 안정적이며 0x30이 RoleType이다.
-    preferred_offsets = [0x30] if key else [0x24]
+    preferred_offsets = [0x30] if is64 else [0x24]
     for offset in preferred_offsets:
         if validate_candidate(offset):
-            _ROLE_OFFSET_CACHE[key] = offset
+            _store_role_offset(key, offset)
             return offset
 
     # RoleType은 2바이트 enum. 0x24~0x80 구간을 추가 검사.
-    search_range = range(0x24, 0x80, 2)
+    search_range = range(0x24, _ROLE_SEARCH_END, 2)
 
     for offset in search_range:
         if offset in preferred_offsets:
             continue
         if validate_candidate(offset):
-            _ROLE_OFFSET_CACHE[key] = offset
+            _store_role_offset(key, offset)
             return offset
 
-    _ROLE_OFFSET_CACHE[key] = None
+    _store_role_offset(key, None)
     return None
 
 
+def prewarm_role_offset(ds: AmongUsDataService) -> Optional[int]:
+    """attach 직후 RoleType 오프셋 탐색을 미리 수행합니다.
+
+    첫 get_player_death_status 호출이 46개 후보 오프셋 검사 비용을 떠안지 않도록 한다.
+    AmongUsDataService는 스레드 안전하지 않으므로 폴링 루프 시작 전에 동기적으로 호출한다.
+    """
+    try:
+        if not ds.memory:
+            return None
+        fields_off = Offsets.OBJ_FIELDS_OFF_X64 if ds.memory.is_64 else Offsets.OBJ_FIELDS_OFF_X86
+        return _detect_role_offset(ds, build_npi_map(ds), fields_off)
+    except Exception:
+        return None
+
+
+def build_npi_map(ds: AmongUsDataService, players: Optional[List[PlayerData]] = None) -> Dict[int, int]:
+    """color_id -> NPI 포인터 맵을 한 번에 구성합니다 (틱당 1회 호출용)."""
+    npi_map: Dict[int, int] = {}
+    if players is None:
+        players = ds.get_all_players() or []
+    for p in players:
+        npi_ptr = ds._get_npi_by_color_id(p.color_id)
+        if npi_ptr:
+            npi_map[p.color_id] = npi_ptr
+    return npi_map
+
+
 def get_player_death_status(
     ds: AmongUsDataService,
     color_id: int,
+    *,
+    npi_map: Optional[Dict[int, int]] = None,
+    collect_diag: bool = True,
 ) -> Tuple[Optional[bool], Dict[str, any]]:
-    """주어진 color_id 플레이어의 사망 여부를 추론합니다."""
+    """주어진 color_id 플레이어의 사망 여부를 추론합니다.
+
+    npi_map을 넘기면 플레이어별 NPI 재탐색을 건너뜁니다 (main()의 폴링 루프처럼
+    한 틱에 여러 플레이어를 확인할 때 사용).
+    collect_diag=False이면 diag에는 "error"만 채워집니다.
+    """
 
     diag: Dict[str, any] = {}
 
@@ -157,19 +248,22 @@ def get_player_death_status(
             diag["error"] = f"player with color_id {color_id} not found"
             return (None, diag)
 
-        diag["color_id"] = color_id
-        diag["color_name"] = player.color_name
-        diag["player_id"] = player.player_id
+        if collect_diag:
+            diag["color_id"] = color_id
+            diag["color_name"] = player.color_name
+            diag["player_id"] = player.player_id
 
-        npi = ds._get_npi_by_color_id(color_id)
+        npi = npi_map.get(color_id) if npi_map else None
+        if not npi:
+            npi = ds._get_npi_by_color_id(color_id)
         if not npi:
             diag["error"] = "NPI not found"
             return (None, diag)
 
-        diag["npi_ptr"] = npi
-
         pc_ptr = ds._get_player_control_from_npi(npi)
-        diag["pc_ptr"] = pc_ptr or 0
+        if collect_diag:
+            diag["npi_ptr"] = npi
+            diag["pc_ptr"] = pc_ptr or 0
 
         is64 = bool(ds.memory.is_64)
         fields_off = Offsets.OBJ_FIELDS_OFF_X64 if is64 else Offsets.OBJ_FIELDS_OFF_X86
@@ -189,48 +283,61 @@ def get_player_death_status(
                 is_dead_offset = ptr_sz * 2 + 2
                 raw = ds.memory.read_u8(base + is_dead_offset)
                 if raw in (0, 1):
-                    diag.update(
-                        {
-                            "method": "CachedPlayerData",
-                            "cached_playerdata_ptr": cached_ptr,
-                            "is_dead_offset": is_dead_offset,
-                            "is_dead_raw": int(raw),
-                        }
-                    )
+                    if collect_diag:
+                        diag.update(
+                            {
+                                "method": "CachedPlayerData",
+                                "cached_playerdata_ptr": cached_ptr,
+                                "is_dead_offset": is_dead_offset,
+                                "is_dead_raw": int(raw),
+                            }
+                        )
                     return (bool(raw), diag)
             except Exception:
-                diag["cached_playerdata_error"] = "read_failed"
+                if collect_diag:
+                    diag["cached_playerdata_error"] = "read_failed"
 
         # 2) RoleType 기반 추론 (NetworkedPlayerInfo)
         #    모든 플레이어의 NPI를 수집하여 RoleType 필드를 동적으로 찾는다.
-        npi_map: Dict[int, int] = {}
-        try:
-            for p in ds.get_all_players() or []:
-                npi_ptr = ds._get_npi_by_color_id(p.color_id)
-                if npi_ptr:
-                    npi_map[p.color_id] = npi_ptr
-        except Exception:
-            # fallback: 최소한 타겟만이라도 포함
-            npi_map[color_id] = npi
+        if npi_map is None:
+            try:
+                npi_map = build_npi_map(ds)
+            except Exception:
+                # fallback: 최소한 타겟만이라도 포함
+                npi_map = {}
 
         if color_id not in npi_map:
+            npi_map = dict(npi_map)
             npi_map[color_id] = npi
 
         role_offset = _detect_role_offset(ds, npi_map, fields_off)
 
         role_types: Dict[int, int] = {}
         if role_offset is not None:
+            now = time.monotonic()
+            pid = _process_id(ds)
             for cid, npi_ptr in npi_map.items():
+                cache_key = (pid, role_offset, cid)
+                cached_role = _ROLE_VALUES_CACHE.get(cache_key)
+                if cached_role is not None and now - cached_role[0] < _ROLE_TTL:
+                    role_types[cid] = cached_role[1]
+                    continue
                 try:
-                    role_types[cid] = _read_u16(ds, npi_ptr + fields_off + role_offset)
+                    val = _read_u16(ds, npi_ptr + fields_off + role_offset)
                 except Exception:
                     continue
+                role_types[cid] = val
+                _ROLE_VALUES_CACHE[cache_key] = (now, val)
 
         if role_types:
-            diag["role_offset"] = role_offset
             role_value = role_types.get(color_id)
             if role_value is not None:
-                role_label = ROLE_TYPE_NAMES.get(role_value, f"Unknown({role_value})")
+                is_dead_via_role = role_value in ROLE_TYPE_DEAD_VALUES
+                if not collect_diag:
+                    return (is_dead_via_role, diag)
+
+                diag["role_offset"] = role_offset
+                role_label = _role_name(role_value) or f"Unknown({role_value})"
                 diag["role_type"] = int(role_value)
                 diag["role_type_label"] = role_label
 
@@ -244,10 +351,9 @@ def get_player_death_status(
                 diag["dead_role_colors"] = sorted(dead_set)
                 diag["impostor_role_colors"] = sorted(impostor_set)
                 diag["role_snapshot"] = {
-                    cid: ROLE_TYPE_NAMES.get(v, str(v)) for cid, v in role_types.items()
+                    cid: _role_name(v) or str(v) for cid, v in role_types.items()
                 }
 
-                is_dead_via_role = role_value in ROLE_TYPE_DEAD_VALUES
                 diag["method"] = "RoleType_inference"
 
                 # 참고용: RoleType과 bool 플래그가 불일치할 경우 경고를 남긴다.
@@ -277,10 +383,11 @@ def get_player_death_status(
             try:
                 val = ds.memory.read_u8(npi_fields + offset)
                 if val in (0, 1):
-                    diag["method"] = "NPI_bool_fallback"
-                    diag["npi_offset"] = offset
-                    diag["is_dead_raw"] = int(val)
-                    diag["note"] = "heuristic fallback - verify manually"
+                    if collect_diag:
+                        diag["method"] = "NPI_bool_fallback"
+                        diag["npi_offset"] = offset
+                        diag["is_dead_raw"] = int(val)
+                        diag["note"] = "heuristic fallback - verify manually"
                     return (bool(val), diag)
             except Exception:
                 continue
@@ -303,23 +410,28 @@ def main():
         return
     
     print("✅ 프로세스 연결 성공\n")
+    prewarm_role_offset(reader._ds)
     print("플레이어 사망 여부 모니터링 시작 (Ctrl+C로 종료)\n")
     
     try:
+        next_tick = time.perf_counter() + _POLL_INTERVAL
         while True:
             players = reader.list_players()
             if not players:
                 print("플레이어를 찾을 수 없습니다...")
-                time.sleep(1.0)
+                next_tick = sleep_until(next_tick, _POLL_INTERVAL)
                 continue
             
             print(f"\n[{time.strftime('%H:%M:%S')}] 플레이어 사망 여부 ({len(players)}명)")
-            print("-" * 60)
-            print(f"{'ColorID':<8} | {'PlayerID':<8} | {'Color Name':<12} | {'Status':<10} | {'Local'}")
-            print("-" * 60)
+            print(_SEP)
+            print(_HEADER)
+            print(_SEP)
             
+            npi_map = build_npi_map(reader._ds, players)
             for player in players:
-                is_dead, diag = get_player_death_status(reader._ds, player.color_id)
+                is_dead, diag = get_player_death_status(
+                    reader._ds, player.color_id, npi_map=npi_map, collect_diag=False
+                )
                 
                 color_id_str = str(player.color_id)
                 player_id_str = str(player.player_id)
@@ -333,9 +445,9 @@ def main():
                 else:
                     status = "❤️ ALIVE"
                 
-                print(f"{color_id_str:<8} | {player_id_str:<8} | {color_name:<12} | {status:<10} | {local_flag}")
+                print(_ROW_FMT(color_id_str, player_id_str, color_name, status, local_flag))
             
-            time.sleep(1.0)
+            next_tick = sleep_until(next_tick, _POLL_INTERVAL)
             
     except KeyboardInterrupt:
         print("\n\n모니터링 종료")
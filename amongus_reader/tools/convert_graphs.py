@@ -0,0 +1,58 @@
+"""
+피클된 NetworkX 내비게이션 그래프(<map>_G.pkl)를 NumPy 배열 형식(<map>_G.npz)으로 변환합니다.
+
+변환 결과는 노드 좌표(pos)와 CSR 인접 배열(indptr/indices/weights)만 담고 있어
+move.py의 GraphManager가 피클을 풀지 않고 바로 로드할 수 있습니다.
+
+사용 예제:
+    python tools/convert_graphs.py            # 기본 그래프 폴더 전체 변환
+    python tools/convert_graphs.py --dir ../graphs --map SHIP
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import os
+
+from move import GraphManager, NavGraph, _LOCAL_GRAPHS_DIR
+
+
+def convert_map(manager: GraphManager, map_name: str) -> bool:
+    G = manager.load_local_nx(map_name)
+    if G is None:
+        print(f"[건너뜀] {map_name}: 그래프 파일 없음")
+        return False
+    nav = NavGraph.from_nx(G)
+    if nav is None:
+        print(f"[건너뜀] {map_name}: 좌표가 없는 노드가 있어 변환할 수 없음")
+        return False
+    out = manager._npz_path(manager.local_dir, map_name)
+    nav.save(out, manager.source_signature(map_name))
+    print(f"[완료] {map_name}: 노드 {len(nav)}개, 간선 {len(nav.indices) // 2}개 -> {out}")
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="내비게이션 그래프 피클을 NPZ로 변환")
+    parser.add_argument("--dir", default=_LOCAL_GRAPHS_DIR, help="<map>_G.pkl(.zst) 파일이 있는 폴더")
+    parser.add_argument("--map", dest="maps", action="append", help="변환할 맵 이름 (여러 번 지정 가능)")
+    args = parser.parse_args()
+
+    manager = GraphManager(args.dir)
+    maps = args.maps
+    if not maps:
+        maps = sorted({
+            os.path.basename(p).split("_G.pkl")[0]
+            for pattern in ("*_G.pkl", "*_G.pkl.zst")
+            for p in glob.glob(os.path.join(args.dir, pattern))
+        })
+    if not maps:
+        print(f"변환할 그래프가 없습니다: {args.dir}")
+        return
+    for map_name in maps:
+        convert_map(manager, map_name)
+
+
+if __name__ == "__main__":
+    main()
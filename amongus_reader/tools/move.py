@@ -1,40 +1,288 @@
 import os
 import sys
+import ctypes
 import math
+import mmap
 import time
+import functools
+import hashlib
+import heapq
 import pickle
 import atexit
-from typing import List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
 
 import networkx as nx
+import numpy as np
 import pyautogui
 
+try:
+    from scipy.spatial import cKDTree
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import dijkstra as csgraph_dijkstra
+except ImportError:  # scipy is optional; fall back to NumPy / heapq paths
+    cKDTree = None
+    csr_matrix = None
+    csgraph_dijkstra = None
+
+try:
+    import zstandard
+except ImportError:  # zstandard is optional; only needed for compressed graphs (<map>_G.pkl.zst)
+    zstandard = None
+
 ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if ROOT_DIR not in sys.path:
     sys.path.insert(0, ROOT_DIR)
 
 from amongus_reader.service import AmongUsReader
+from _nav_kernels import HAVE_NUMBA, nearest as _nearest_kernel, reconstruct_list as _reconstruct_path
+from _timing import sleep_until
 
 _LOCAL_GRAPHS_DIR = os.path.join(os.path.dirname(__file__), "graphs")
 
 
+# (pred[N][N] int32, node -> row index); pred[s, t] is t's predecessor on the s->t shortest path
+APSP = Tuple[np.ndarray, Dict[Any, int]]
+
+
+class NavGraph:
+    """Compact nav graph: node positions plus a symmetric CSR adjacency.
+
+    pos[i] is node i's world position; the neighbours of i are
+    indices[indptr[i]:indptr[i+1]] with matching weights.
+    """
+
+    def __init__(self, pos: np.ndarray, indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray):
+        self.pos = np.asarray(pos, dtype=np.float64)
+        self.indptr = np.asarray(indptr, dtype=np.int32)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.nodes: List[Tuple[float, float]] = [(float(x), float(y)) for x, y in self.pos.tolist()]
+        self.node_ids: Dict[Any, int] = {n: i for i, n in enumerate(self.nodes)}
+        # The numba kernel beats a KD-tree query at this graph size, so only build the tree without it.
+        use_tree = cKDTree is not None and not HAVE_NUMBA and len(self.nodes)
+        self.tree = cKDTree(self.pos) if use_tree else None
+        self._csr = None
+        self._h_scale: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    @classmethod
+    def from_nx(cls, G: nx.Graph) -> Optional["NavGraph"]:
+        # One pass over (node, pos) in G's insertion order; no per-node G.nodes[n] lookup or sort
+        nodes = []
+        pos = []
+        for n, p in G.nodes(data="pos"):
+            if isinstance(n, (tuple, list)) and len(n) == 2:
+                p = n
+            elif p is None:
+                return None
+            nodes.append(n)
+            pos.append((float(p[0]), float(p[1])))
+        if not nodes:
+            return None
+        ids = {n: i for i, n in enumerate(nodes)}
+        indptr = [0]
+        indices: List[int] = []
+        weights: List[float] = []
+        for n in nodes:
+            for nbr, data in G.adj[n].items():
+                indices.append(ids[nbr])
+                weights.append(float(data.get("weight", 1.0)))
+            indptr.append(len(indices))
+        return cls(np.asarray(pos), np.asarray(indptr), np.asarray(indices), np.asarray(weights))
+
+    @classmethod
+    def load(cls, path: str, src: Optional[np.ndarray] = None) -> Optional["NavGraph"]:
+        """Load arrays written by save(); None if they were built from a different source file."""
+        with np.load(path) as data:
+            if src is not None and ("src" not in data.files or not np.array_equal(data["src"], src)):
+                return None
+            return cls(data["pos"], data["indptr"], data["indices"], data["weights"])
+
+    def save(self, path: str, src: Optional[np.ndarray] = None) -> None:
+        arrays = dict(pos=self.pos, indptr=self.indptr, indices=self.indices, weights=self.weights)
+        if src is not None:
+            arrays["src"] = src
+        np.savez(path, **arrays)
+
+    def digest(self) -> np.ndarray:
+        """Fingerprint of the node layout and edges, used to validate derived caches."""
+        h = hashlib.blake2b(digest_size=16)
+        for arr in (self.pos, self.indptr, self.indices, self.weights):
+            h.update(np.ascontiguousarray(arr).tobytes())
+        return np.frombuffer(h.digest(), dtype=np.uint8)
+
+    def csr(self):
+        if self._csr is None and csr_matrix is not None:
+            n = len(self.nodes)
+            self._csr = csr_matrix((self.weights, self.indices, self.indptr), shape=(n, n))
+        return self._csr
+
+    def nearest_index(self, pos: Tuple[float, float]) -> int:
+        if self.tree is not None:
+            return int(self.tree.query(pos, k=1)[1])
+        return int(_nearest_kernel(self.pos, float(pos[0]), float(pos[1])))
+
+    def nearest(self, pos: Tuple[float, float]) -> Tuple[float, float]:
+        return self.nodes[self.nearest_index(pos)]
+
+    def predecessors(self, s_idx: Optional[int] = None) -> np.ndarray:
+        """Dijkstra predecessor row for one source, or the full matrix when s_idx is None."""
+        graph = self.csr()
+        if graph is not None:
+            _, pred = csgraph_dijkstra(graph, indices=s_idx, return_predecessors=True)
+            return pred.astype(np.int32, copy=False)
+        sources = range(len(self.nodes)) if s_idx is None else (s_idx,)
+        rows = np.stack([self._heap_dijkstra(i) for i in sources])
+        return rows if s_idx is None else rows[0]
+
+    def _heap_dijkstra(self, s_idx: int) -> np.ndarray:
+        indptr, indices, weights = self.indptr, self.indices, self.weights
+        dist = {s_idx: 0.0}
+        pred = np.full(len(self.nodes), -1, dtype=np.int32)
+        done = set()
+        heap = [(0.0, s_idx)]
+        while heap:
+            d, u = heapq.heappop(heap)
+            if u in done:
+                continue
+            done.add(u)
+            for k in range(indptr[u], indptr[u + 1]):
+                v = int(indices[k])
+                nd = d + weights[k]
+                if nd < dist.get(v, math.inf):
+                    dist[v] = nd
+                    pred[v] = u
+                    heapq.heappush(heap, (nd, v))
+        return pred
+
+    def _heuristic_scale(self) -> float:
+        """Largest factor k for which k * straight-line distance never exceeds an edge's weight.
+
+        Recorded weights are rounded Euclidean lengths, so this is just under 1; it keeps the
+        A* potentials consistent for hand-edited or unit-weight graphs too.
+        """
+        if self._h_scale is None:
+            src = np.repeat(np.arange(len(self.nodes)), np.diff(self.indptr))
+            d = self.pos[src] - self.pos[self.indices]
+            lengths = np.hypot(d[:, 0], d[:, 1])
+            mask = lengths > 0
+            ratio = float((self.weights[mask] / lengths[mask]).min()) if mask.any() else 0.0
+            # Leave a little slack so float error cannot make a reduced weight negative.
+            self._h_scale = max(0.0, min(1.0, ratio)) * (1.0 - 1e-9)
+        return self._h_scale
+
+    def _heap_path(self, s_idx: int, t_idx: int) -> Optional[List[int]]:
+        """Bidirectional A* from s and t over the (symmetric) adjacency.
+
+        Both searches run Dijkstra on weights reduced by the average potential
+        p(v) = (|v - t| - |v - s|) / 2 of the straight-line heuristic, which steers them
+        toward each other; the reduction shifts every s -> t route by the same constant,
+        so the route found is still a shortest one. Stops once the two frontiers can no
+        longer beat the best meeting point found.
+        """
+        if s_idx == t_idx:
+            return [s_idx]
+        indptr, indices, weights = self.indptr, self.indices, self.weights
+        pos = self.pos
+        to_t = np.hypot(pos[:, 0] - pos[t_idx, 0], pos[:, 1] - pos[t_idx, 1])
+        to_s = np.hypot(pos[:, 0] - pos[s_idx, 0], pos[:, 1] - pos[s_idx, 1])
+        pot = ((to_t - to_s) * (0.5 * self._heuristic_scale())).tolist()
+        dist = ({s_idx: 0.0}, {t_idx: 0.0})
+        pred = ({s_idx: -1}, {t_idx: -1})
+        done = (set(), set())
+        heaps = ([(0.0, s_idx)], [(0.0, t_idx)])
+        best = math.inf
+        meet = -1
+        while heaps[0] and heaps[1]:
+            if heaps[0][0][0] + heaps[1][0][0] >= best:
+                break
+            side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+            d, u = heapq.heappop(heaps[side])
+            if u in done[side]:
+                continue
+            done[side].add(u)
+            near, far, back = dist[side], dist[1 - side], pred[side]
+            # Forward search adds p(v) - p(u); the reverse search walks edges backwards and subtracts it.
+            pu = pot[u] if side == 0 else -pot[u]
+            for k in range(indptr[u], indptr[u + 1]):
+                v = int(indices[k])
+                nd = d + weights[k] - pu + (pot[v] if side == 0 else -pot[v])
+                if nd < near.get(v, math.inf):
+                    near[v] = nd
+                    back[v] = u
+                    heapq.heappush(heaps[side], (nd, v))
+                if v in far and near[v] + far[v] < best:
+                    best = near[v] + far[v]
+                    meet = v
+        if meet < 0:
+            return None
+        path = []
+        cur = meet
+        while cur >= 0:
+            path.append(cur)
+            cur = pred[0][cur]
+        path.reverse()
+        cur = pred[1][meet]
+        while cur >= 0:
+            path.append(cur)
+            cur = pred[1][cur]
+        return path
+
+    def shortest_path(self, s_idx: int, t_idx: int) -> Optional[List[int]]:
+        """Node indices of the shortest s -> t path, or None if unreachable."""
+        if self.csr() is None:
+            return self._heap_path(s_idx, t_idx)
+        return _reconstruct_path(self.predecessors(s_idx), s_idx, t_idx)
+
+
 class GraphManager:
     def __init__(self, local_dir: str):
         self.local_dir = local_dir
         self._cache = {}
+        self._nav_cache = {}
+        self._apsp_cache = {}
 
     def _nx_path(self, base: str, map_name: str) -> str:
         return os.path.join(base, f"{map_name}_G.pkl")
 
+    def _zst_path(self, base: str, map_name: str) -> str:
+        return os.path.join(base, f"{map_name}_G.pkl.zst")
+
+    def _source_path(self, map_name: str) -> str:
+        """The published graph: <map>_G.pkl.zst when the recorder compressed it, else <map>_G.pkl."""
+        zst = self._zst_path(self.local_dir, map_name)
+        return zst if os.path.exists(zst) else self._nx_path(self.local_dir, map_name)
+
     def _points_path(self, base: str, map_name: str) -> str:
         return os.path.join(base, f"{map_name}_graph.pkl")
 
+    def _npz_path(self, base: str, map_name: str) -> str:
+        return os.path.join(base, f"{map_name}_G.npz")
+
+    def _apsp_path(self, base: str, map_name: str) -> str:
+        return os.path.join(base, f"{map_name}_apsp.npz")
+
+    def source_signature(self, map_name: str) -> Optional[np.ndarray]:
+        """(size, mtime_ns) of the published graph, stored in the .npz built from it; None if absent."""
+        try:
+            st = os.stat(self._source_path(map_name))
+        except OSError:
+            return None
+        return np.array([st.st_size, st.st_mtime_ns], dtype=np.int64)
+
     def load_local_nx(self, map_name: str) -> Optional[nx.Graph]:
-        path = self._nx_path(self.local_dir, map_name)
+        path = self._source_path(map_name)
         if not os.path.exists(path):
             return None
-        with open(path, "rb") as f:
-            return pickle.load(f)
+        # Unpickle straight from the page cache instead of copying the file through read() buffers.
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if path.endswith(".zst"):
+                if zstandard is None:
+                    raise RuntimeError(f"{path} is zstd-compressed; install zstandard to load it")
+                return pickle.loads(zstandard.ZstdDecompressor().decompress(mm))
+            return pickle.load(mm)
 
     def get_graph(self, map_name: str) -> Optional[nx.Graph]:
         if map_name in self._cache:
@@ -43,6 +291,63 @@ class GraphManager:
         self._cache[map_name] = G
         return G
 
+    def get_nav_graph(self, map_name: str) -> Optional[NavGraph]:
+        """Return the compact nav graph, preferring <map>_G.npz over the pickled graph."""
+        if map_name in self._nav_cache:
+            return self._nav_cache[map_name]
+        nav = None
+        npz = self._npz_path(self.local_dir, map_name)
+        # The .npz records the signature of the pickle it came from; a re-published
+        # <map>_G.pkl changes it. Without a pickle the .npz is the only source.
+        src = self.source_signature(map_name)
+        if os.path.exists(npz):
+            try:
+                nav = NavGraph.load(npz, src)
+            except Exception:
+                nav = None
+        if nav is None:
+            G = self.get_graph(map_name)
+            nav = NavGraph.from_nx(G) if G is not None else None
+            if nav is not None:
+                # Cache the arrays so later runs skip unpickling the NetworkX graph.
+                try:
+                    nav.save(npz, src)
+                except OSError:
+                    pass
+        self._nav_cache[map_name] = nav
+        return nav
+
+    def get_apsp(self, map_name: str) -> Optional[APSP]:
+        """Return the all-pairs predecessor matrix for a map, or None."""
+        if map_name in self._apsp_cache:
+            return self._apsp_cache[map_name]
+        apsp = self._load_or_build_apsp(map_name)
+        self._apsp_cache[map_name] = apsp
+        return apsp
+
+    def _load_or_build_apsp(self, map_name: str) -> Optional[APSP]:
+        nav = self.get_nav_graph(map_name)
+        if nav is None:
+            return None
+        path = self._apsp_path(self.local_dir, map_name)
+        digest = nav.digest()
+        if os.path.exists(path):
+            try:
+                with np.load(path) as data:
+                    # Only trust the cache if it was built for the same nodes and edges.
+                    if np.array_equal(data["digest"], digest):
+                        return data["pred"], nav.node_ids
+            except Exception:
+                pass
+        try:
+            pred = nav.predecessors()
+        except Exception:
+            return None
+        try:
+            np.savez(path, digest=digest, pred=pred)
+        except OSError:
+            pass
+        return pred, nav.node_ids
 
 _GRAPH_MANAGER = None
 _CURRENT_MAP = "SHIP"
@@ -87,8 +392,10 @@ def get_graph_manager() -> GraphManager:
 def set_current_map(map_name: str):
     global _CURRENT_MAP
     if map_name:
-        key = _MAP_ALIASES.get(str(map_name).strip().lower(), map_name)
-        _CURRENT_MAP = str(key)
+        key = str(_MAP_ALIASES.get(str(map_name).strip().lower(), map_name))
+        if key != _CURRENT_MAP:
+            _plan_path_cached.cache_clear()
+        _CURRENT_MAP = key
 
 
 def get_current_map() -> str:
@@ -106,58 +413,78 @@ def load_map_graph(map_name: str) -> nx.Graph:
     return get_graph_manager().get_graph(map_name)
 
 
-def _node_pos(G: nx.Graph, n) -> Tuple[float, float]:
-    if isinstance(n, (tuple, list)) and len(n) == 2:
-        return (float(n[0]), float(n[1]))
+def _find_nearest(nav: NavGraph, pos: Tuple[float, float]) -> Tuple[float, float]:
+    return nav.nearest(pos)
+
+
+def _shortest_nodes(nav: NavGraph, apsp: Optional[APSP], s, t) -> list:
+    """Shortest node path s -> t: APSP cache, else CSR Dijkstra."""
+    s_idx = nav.node_ids[s]
+    t_idx = nav.node_ids[t]
+    if apsp is not None:
+        idx_path = _reconstruct_path(apsp[0][s_idx], s_idx, t_idx)
+    else:
+        idx_path = nav.shortest_path(s_idx, t_idx)
+    if idx_path is None:
+        raise nx.NetworkXNoPath(f"No path between {s} and {t}.")
+    return [nav.nodes[i] for i in idx_path]
+
+
+def _plan_node_waypoints(
+    nav: NavGraph,
+    apsp: Optional[APSP],
+    cur: Tuple[float, float],
+    dest: Tuple[float, float],
+) -> Tuple[Tuple[float, float], ...]:
+    """Node waypoints from the node nearest cur to the node nearest dest (dest itself excluded)."""
     try:
-        p = G.nodes[n].get('pos')
+        s = _find_nearest(nav, cur)
+        t = _find_nearest(nav, dest)
     except Exception:
-        p = None
-    if p is None:
-        raise KeyError("node has no position")
-    return (float(p[0]), float(p[1]))
-
-
-def _nearest_node(G: nx.Graph, pos: Tuple[float, float]) -> Tuple[float, float]:
-    """Return the nearest node in G to a world position."""
-    best, best_d = None, float("inf")
-    for n in G.nodes:
-        pn = _node_pos(G, n)
-        d = math.dist(pn, pos)
-        if d < best_d:
-            best, best_d = n, d
-    return best
-
-
-def _shortest_path(G: nx.Graph, start_pos: Tuple[float, float], dest_pos: Tuple[float, float]) -> List[Tuple[float, float]]:
-    """Plan a shortest path between nearest nodes to start and dest (inclusive)."""
-    s = _nearest_node(G, start_pos)
-    t = _nearest_node(G, dest_pos)
-    if s is None or t is None:
-        return []
-    if s == t:
-        return [_node_pos(G, s)]
+        return ()
     try:
-        nodes = nx.shortest_path(G, s, t, weight="weight")
+        nodes = _shortest_nodes(nav, apsp, s, t)
     except Exception:
-        return []
-    path_coords = []
-    for n in nodes:
-        try:
-            path_coords.append(_node_pos(G, n))
-        except Exception:
-            continue
-    return path_coords
-
-
-def _stick_vector(src: Tuple[float, float], dst: Tuple[float, float]) -> Tuple[float, float]:
-    """Compute a normalized movement vector from src to dst in world space."""
-    dx = dst[0] - src[0]
-    dy = dst[1] - src[1]
-    l = math.hypot(dx, dy)
-    if l == 0:
-        return (0.0, 0.0)
-    return (dx / l, dy / l)
+        nodes = None
+    # Nav nodes are their own (x, y) positions.
+    coords: List[Tuple[float, float]] = [s, *(nodes[1:-1] if nodes else ()), t]
+    # Drop consecutive duplicates in one pass.
+    return tuple(c for i, c in enumerate(coords) if i == 0 or c != coords[i - 1])
+
+
+@functools.lru_cache(maxsize=1024)
+def _plan_path_cached(
+    map_name: str,
+    cur_key: Tuple[float, float],
+    dest_key: Tuple[float, float],
+) -> Tuple[Tuple[float, float], ...]:
+    """Memoized node waypoints keyed on 0.1-unit quantized start/dest cells."""
+    manager = get_graph_manager()
+    nav = manager.get_nav_graph(map_name)
+    if nav is None:
+        return ()
+    # Nav nodes are position tuples, so planning never needs the pickled graph.
+    return _plan_node_waypoints(nav, manager.get_apsp(map_name), cur_key, dest_key)
+
+
+_TIMER_PERIOD_SET = False
+
+
+def _enable_high_res_timer() -> None:
+    """Raise the Windows timer resolution to 1 ms once (restored at exit) so short sleeps are accurate."""
+    global _TIMER_PERIOD_SET
+    if _TIMER_PERIOD_SET:
+        return
+    _TIMER_PERIOD_SET = True
+    try:
+        winmm = ctypes.windll.winmm
+    except AttributeError:
+        return
+    try:
+        winmm.timeBeginPeriod(1)
+        atexit.register(winmm.timeEndPeriod, 1)
+    except Exception:
+        pass
 
 
 def _get_player_position() -> Tuple[float, float]:
@@ -185,70 +512,66 @@ class MovementController:
         resolved = map_name or get_current_map()
         alias = _MAP_ALIASES.get(str(resolved).strip().lower(), resolved)
         self.map_name = alias
-        self.G = load_map_graph(self.map_name)
-        if self.G is None and self.map_name != "SHIP":
+        manager = get_graph_manager()
+        self.nav = manager.get_nav_graph(self.map_name)
+        if self.nav is None and self.map_name != "SHIP":
             self.map_name = "SHIP"
-            self.G = load_map_graph(self.map_name)
+            self.nav = manager.get_nav_graph(self.map_name)
+        if self.nav is not None:
+            # Build the APSP cache up front so the first plan_path is cheap.
+            manager.get_apsp(self.map_name)
+
+    @property
+    def G(self) -> Optional[nx.Graph]:
+        """The pickled NetworkX graph for this map (loaded on first access)."""
+        return load_map_graph(self.map_name)
 
     def plan_path(self, dest: Tuple[float, float]) -> List[Tuple[float, float]]:
         """Return a path (list of waypoints) from current position to dest using nav graph."""
         cur = _get_player_position()
-        if self.G is None or getattr(self.G, 'number_of_nodes', lambda: 0)() == 0:
-            return [dest]
-        waypoints: List[Tuple[float, float]] = []
-        try:
-            s = _nearest_node(self.G, cur)
-            t = _nearest_node(self.G, dest)
-        except Exception:
+        if self.nav is None or len(self.nav) == 0:
             return [dest]
-        try:
-            nodes = nx.shortest_path(self.G, s, t, weight="weight")
-        except Exception:
-            nodes = [s, t]
-        try:
-            s_pos = _node_pos(self.G, s)
-            if not waypoints or waypoints[-1] != s_pos:
-                waypoints.append(s_pos)
-        except Exception:
-            pass
-        if nodes:
-            for n in nodes[1:-1]:
-                try:
-                    p = _node_pos(self.G, n)
-                    if not waypoints or waypoints[-1] != p:
-                        waypoints.append(p)
-                except Exception:
-                    continue
-        try:
-            t_pos = _node_pos(self.G, t)
-            if not waypoints or waypoints[-1] != t_pos:
-                waypoints.append(t_pos)
-        except Exception:
-            pass
+        cur_key = (round(cur[0], 1), round(cur[1], 1))
+        dest_key = (round(dest[0], 1), round(dest[1], 1))
+        waypoints = list(_plan_path_cached(self.map_name, cur_key, dest_key))
         if not waypoints:
             return [dest]
         if waypoints[-1] != dest:
             waypoints.append(dest)
         return waypoints
 
-    def next_step(self, path: List[Tuple[float, float]], arrive_threshold: float = 0.2) -> Tuple[Tuple[float, float], List[Tuple[float, float]]]:
+    def next_step(
+        self,
+        path: List[Tuple[float, float]],
+        arrive_threshold: float = 0.2,
+        pos: Optional[Tuple[float, float]] = None,
+    ) -> Tuple[Tuple[float, float], List[Tuple[float, float]]]:
         """Compute the next stick vector given a path and live position.
 
+        pos: position the caller already read this tick; read from the game when omitted.
         Returns (stick_vector, remaining_path). If already arrived, returns ((0,0), []).
         """
         if not path:
             return (0.0, 0.0), []
-        pos = _get_player_position()
+        if pos is None:
+            pos = _get_player_position()
         # Adjust arrive threshold by speed if needed.
+        # Arrival is checked on the squared distance; the sqrt is only taken to normalize.
         waypoint = path[0]
-        if math.dist(pos, waypoint) <= arrive_threshold:
+        dx = waypoint[0] - pos[0]
+        dy = waypoint[1] - pos[1]
+        if dx * dx + dy * dy <= arrive_threshold * arrive_threshold:
             path = path[1:]
             if not path:
                 return (0.0, 0.0), []
             waypoint = path[0]
+            dx = waypoint[0] - pos[0]
+            dy = waypoint[1] - pos[1]
         # print("pos:", pos, "waypoint:", waypoint)  #========== 디버그용 (주석 처리)
-        vec = _stick_vector(pos, waypoint)
-        return vec, path
+        d = math.hypot(dx, dy)
+        if d == 0:
+            return (0.0, 0.0), path
+        return (dx / d, dy / d), path
 
     def move_blocking(self, dest: Tuple[float, float], tick_rate: float = 30.0, arrive_radius: float = 0.2):
         """Blocking loop that yields stick vectors until arrival.
@@ -259,66 +582,141 @@ class MovementController:
         """
         path = self.plan_path(dest)
         dt = 1.0 / tick_rate
+        _enable_high_res_timer()
+        next_tick = time.perf_counter() + dt
         last_vec = (0.0, 0.0)
         while path:
             vec, path = self.next_step(path, arrive_threshold=arrive_radius)
             last_vec = vec
             # Caller can map vec -> input. For example: hold WASD or analog stick toward vec.
             # TODO: If you want auto-input, integrate a sender here and ensure proper focus + timing.
-            time.sleep(dt)
+            next_tick = sleep_until(next_tick, dt)
         return last_vec
 
 
+# --- SendInput keystrokes (Windows) -------------------------------------------
+# Scan codes for the movement keys; SendInput with KEYEVENTF_SCANCODE is far
+# cheaper than pyautogui's per-key path and lets a tick's key changes go out in one call.
+_SCANCODES = {'w': 0x11, 'a': 0x1E, 's': 0x1F, 'd': 0x20}
+_MOVE_KEYS = frozenset(_SCANCODES)
+_INPUT_KEYBOARD = 1
+_KEYEVENTF_KEYUP = 0x0002
+_KEYEVENTF_SCANCODE = 0x0008
+
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", ctypes.c_uint16),
+        ("wScan", ctypes.c_uint16),
+        ("dwFlags", ctypes.c_uint32),
+        ("time", ctypes.c_uint32),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", ctypes.c_int32),
+        ("dy", ctypes.c_int32),
+        ("mouseData", ctypes.c_uint32),
+        ("dwFlags", ctypes.c_uint32),
+        ("time", ctypes.c_uint32),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _INPUT_UNION(ctypes.Union):
+    _fields_ = [("ki", _KEYBDINPUT), ("mi", _MOUSEINPUT)]
+
+
+class _INPUT(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_uint32), ("u", _INPUT_UNION)]
+
+
+def _make_key_input(key: str, down: bool) -> _INPUT:
+    flags = _KEYEVENTF_SCANCODE | (0 if down else _KEYEVENTF_KEYUP)
+    inp = _INPUT(type=_INPUT_KEYBOARD)
+    inp.u.ki = _KEYBDINPUT(wVk=0, wScan=_SCANCODES[key], dwFlags=flags, time=0, dwExtraInfo=0)
+    return inp
+
+
+# Pre-built INPUT records per (key, down)
+_KEY_INPUTS = {(k, down): _make_key_input(k, down) for k in _SCANCODES for down in (True, False)}
+
+try:
+    _SendInput = ctypes.windll.user32.SendInput
+except AttributeError:  # not on Windows -> pyautogui fallback
+    _SendInput = None
+
+
+def _send_key_events(events: List[Tuple[str, bool]]) -> bool:
+    """Send all (key, down) events in one SendInput call. Returns False if unavailable."""
+    if _SendInput is None or not all(k in _MOVE_KEYS for k, _ in events):
+        return False
+    n = len(events)
+    arr = (_INPUT * n)(*(_KEY_INPUTS[e] for e in events))
+    return _SendInput(n, arr, ctypes.sizeof(_INPUT)) == n
+
+
+def _pyautogui_key_events(events: List[Tuple[str, bool]]) -> None:
+    for k, down in events:
+        try:
+            if down:
+                pyautogui.keyDown(k)
+            else:
+                pyautogui.keyUp(k)
+        except Exception:
+            pass
+
+
+# Held keys per (x-sign, y-sign) outside the deadzone; frozensets so a tick's
+# result can be compared with and stored as the held set without copying.
+_KEYS_BY_SIGN = {
+    (sx, sy): frozenset(
+        ({1: 'd', -1: 'a'}.get(sx, ''), {1: 'w', -1: 's'}.get(sy, ''))
+    ) & _MOVE_KEYS
+    for sx in (-1, 0, 1)
+    for sy in (-1, 0, 1)
+}
+
+
 class KeyboardDriver:
     def __init__(self, deadzone: float = 0.2):
         self.deadzone = deadzone
-        self._down = set()
+        self._down = frozenset()
+        _enable_high_res_timer()
 
-    def _desired_keys(self, vec: Tuple[float, float]) -> set:
+    def _desired_keys(self, vec: Tuple[float, float]) -> frozenset:
         dx, dy = vec
-        want = set()
-        if dy > self.deadzone:
-            want.add('w')
-        elif dy < -self.deadzone:
-            want.add('s')
-        if dx > self.deadzone:
-            want.add('d')
-        elif dx < -self.deadzone:
-            want.add('a')
-        return want
-
-    def _apply_keys(self, want: set):
-        for k in list(self._down):
-            if k not in want:
-                try:
-                    pyautogui.keyUp(k)
-                except Exception:
-                    pass
-                self._down.discard(k)
-        for k in want:
-            if k not in self._down:
-                try:
-                    pyautogui.keyDown(k)
-                except Exception:
-                    pass
-                self._down.add(k)
+        dz = self.deadzone
+        return _KEYS_BY_SIGN[((dx > dz) - (dx < -dz), (dy > dz) - (dy < -dz))]
+
+    def _emit(self, events: List[Tuple[str, bool]]) -> None:
+        if events and not _send_key_events(events):
+            _pyautogui_key_events(events)
+
+    def _apply_keys(self, want: frozenset):
+        down = self._down
+        if want == down:
+            return
+        events = [(k, False) for k in down - want]
+        events += [(k, True) for k in want - down]
+        self._emit(events)
+        self._down = frozenset(want)
 
     def release_all(self):
-        for k in list(self._down):
-            try:
-                pyautogui.keyUp(k)
-            except Exception:
-                pass
-        self._down.clear()
+        self._emit([(k, False) for k in self._down])
+        self._down = frozenset()
 
     def drive_path(self, ctrl: 'MovementController', path: List[Tuple[float, float]], tick_rate: float = 30.0, arrive_radius: float = 0.2):
         dt = 1.0 / tick_rate
+        next_tick = time.perf_counter() + dt
         try:
             while path:
                 vec, path = ctrl.next_step(path, arrive_threshold=arrive_radius)
                 want = self._desired_keys(vec)
                 self._apply_keys(want)
-                time.sleep(dt)
+                next_tick = sleep_until(next_tick, dt)
         finally:
             self.release_all()
 
@@ -344,26 +742,30 @@ def move_player_to(
     dt = 1.0 / tick_rate
     success = False
     try:
-        last_pos = _get_player_position()
+        # One position read per tick, shared by next_step and the arrival/progress checks.
+        arrive_sq = arrive_radius * arrive_radius
+        progress_sq = (arrive_radius * 0.1) ** 2
+        cur_pos = _get_player_position()
+        last_pos = cur_pos
         last_progress_time = time.time()
+        next_tick = time.perf_counter() + dt
         while path:
-            vec, path = ctrl.next_step(path, arrive_threshold=arrive_radius)
+            vec, path = ctrl.next_step(path, arrive_threshold=arrive_radius, pos=cur_pos)
             want = kd._desired_keys(vec)
             kd._apply_keys(want)
-            time.sleep(dt)
+            next_tick = sleep_until(next_tick, dt)
             cur_pos = _get_player_position()
-            if math.dist(cur_pos, dest) <= arrive_radius:
+            if (cur_pos[0] - dest[0]) ** 2 + (cur_pos[1] - dest[1]) ** 2 <= arrive_sq:
                 success = True
                 path = []
                 break
-            if math.dist(cur_pos, last_pos) >= arrive_radius * 0.1:
+            if (cur_pos[0] - last_pos[0]) ** 2 + (cur_pos[1] - last_pos[1]) ** 2 >= progress_sq:
                 last_pos = cur_pos
                 last_progress_time = time.time()
             elif time.time() - last_progress_time > timeout:
                 break
         if not path and not success:
-            cur_pos = _get_player_position()
-            success = math.dist(cur_pos, dest) <= arrive_radius
+            success = (cur_pos[0] - dest[0]) ** 2 + (cur_pos[1] - dest[1]) ** 2 <= arrive_sq
     finally:
         kd.release_all()
     return success
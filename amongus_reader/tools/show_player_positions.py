@@ -21,6 +21,7 @@ if str(ROOT_DIR) not in sys.path:
 
 
 from amongus_reader import AmongUsReader, PlayerData
+from amongus_reader.tools._timing import sleep_until
 
 
 DEFAULT_INTERVAL = 0.5
@@ -55,78 +56,115 @@ def _attempt_attach(
 def _collect_snapshot(reader: AmongUsReader) -> List[SnapshotRow]:
     """Return a sorted list of (color_id, player_id, x, y, color_name, is_local)."""
     players: List[PlayerData] = reader.list_players() or []
-
     positions: Dict[int, Tuple[float, float]] = reader.positions() or {}
     if players and len(positions) < len(players):
+        # Stale PlayerControl map: rebuild it for the next tick instead of re-reading now.
         reader.invalidate_players_pc_map()
-        positions = reader.positions() or {}
 
     colors = reader.colors()
+    colors_get = colors.get
+    positions_get = positions.get
     snapshot: List[SnapshotRow] = []
+    append = snapshot.append
     seen: set[int] = set()
 
     for pdata in players:
-        color_id: Optional[int] = getattr(pdata, "color_id", None)
-        player_id: Optional[int] = getattr(pdata, "player_id", None)
+        color_id: Optional[int] = pdata.color_id
 
         # PlayerData.position is generally reliable and per-player; prefer it over the
         # shared per-call positions() result so we avoid collapsing multiple players
         # that accidentally share the same color_id mapping.
-        pos: Optional[Tuple[float, float]] = getattr(pdata, "position", None)
+        pos: Optional[Tuple[float, float]] = pdata.position
         if pos is None and color_id is not None:
-            pos = positions.get(color_id)
-
-        if pos is None:
-            x_val = None
-            y_val = None
-        else:
-            x_val, y_val = pos
+            pos = positions_get(color_id)
+        x_val, y_val = pos if pos is not None else (None, None)
 
         color_name = (
-            getattr(pdata, "color_name", None)
-            or (colors.get(color_id) if color_id is not None else None)
+            pdata.color_name
+            or (colors_get(color_id) if color_id is not None else None)
             or "Unknown"
         )
-        is_local = bool(getattr(pdata, "is_local_player", False))
-        snapshot.append((color_id, player_id, x_val, y_val, color_name, is_local))
+        append((color_id, pdata.player_id, x_val, y_val, color_name, bool(pdata.is_local_player)))
         if color_id is not None:
             seen.add(color_id)
 
     # Include any players visible via positions() but missing from list_players()
-    for color_id, pos in sorted(positions.items()):
-        if color_id in seen:
-            continue
-        x_val, y_val = pos
-        color_name = colors.get(color_id, "Unknown")
-        snapshot.append((color_id, None, x_val, y_val, color_name, False))
-
+    snapshot.extend(
+        (color_id, None, pos[0], pos[1], colors_get(color_id, "Unknown"), False)
+        for color_id, pos in sorted(positions.items())
+        if color_id not in seen
+    )
     return snapshot
 
 
-def _clear_screen() -> None:
-    if os.name == "nt":
-        os.system("cls")
-    else:
-        os.system("clear")
+_ANSI_HOME = "\x1b[H"
+_ANSI_CLEAR = "\x1b[H\x1b[2J"
+_ANSI_ERASE_EOL = "\x1b[K"
+_ANSI_ERASE_BELOW = "\x1b[J"
+
+
+def _enable_vt_mode() -> None:
+    """Windows 콘솔에서 ANSI 이스케이프 시퀀스를 처리하도록 설정합니다."""
+    if os.name != "nt":
+        return
+    try:
+        import ctypes
 
+        ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            kernel32.SetConsoleMode(handle, mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING)
+    except Exception:
+        pass
 
-def _render_snapshot(rows: Iterable[SnapshotRow]) -> None:
+
+def _clear_screen(full: bool = True) -> None:
+    """Clear via ANSI escapes (no cls/clear subprocess); full=False only homes the cursor."""
+    sys.stdout.write(_ANSI_CLEAR if full else _ANSI_HOME)
+    sys.stdout.flush()
+
+
+_ROW_FMT = "{cid:>7} | {pid:>8} | {L} | {name:<12} | {x} | {y}".format
+_TABLE_HEADER = "ColorID | PlayerID | L | Color        |        X |        Y"
+_TABLE_SEP = "-" * 60
+_MISSING_COORD = "   --   "
+
+
+def _render_snapshot(rows: Iterable[SnapshotRow], overwrite: bool = False) -> None:
+    """Print the table; overwrite=True erases stale text when redrawing over the previous frame."""
     rows = list(rows)
     timestamp = time.strftime("%H:%M:%S")
     if not rows:
-        print(f"[{timestamp}] 플레이어 위치 데이터를 찾을 수 없습니다. 게임이 로비 상태인지 확인하세요.")
+        msg = f"[{timestamp}] 플레이어 위치 데이터를 찾을 수 없습니다. 게임이 로비 상태인지 확인하세요."
+        if overwrite:
+            msg += _ANSI_ERASE_EOL + "\n" + _ANSI_ERASE_BELOW
+            sys.stdout.write(msg)
+            sys.stdout.flush()
+        else:
+            print(msg)
         return
 
-    print(f"[{timestamp}] 플레이어 위치 ({len(rows)}명)")
-    print("ColorID | PlayerID | L | Color        |        X |        Y")
-    print("------------------------------------------------------------")
+    lines = [f"[{timestamp}] 플레이어 위치 ({len(rows)}명)", _TABLE_HEADER, _TABLE_SEP]
+    append = lines.append
+    row_fmt = _ROW_FMT
     for color_id, player_id, x, y, color_name, is_local in rows:
-        local_flag = "L" if is_local else " "
-        x_str = f"{x:8.3f}" if x is not None else "   --   "
-        y_str = f"{y:8.3f}" if y is not None else "   --   "
-        color_id_str = "??" if color_id is None or color_id < 0 else f"{color_id:2d}"
-        player_id_str = "??" if player_id is None or player_id < 0 else f"{player_id:2d}"
-        print(f"{color_id_str:>7} | {player_id_str:>8} | {local_flag} | {color_name:<12} | {x_str} | {y_str}")
+        append(row_fmt(
+            cid="??" if color_id is None or color_id < 0 else f"{color_id:2d}",
+            pid="??" if player_id is None or player_id < 0 else f"{player_id:2d}",
+            L="L" if is_local else " ",
+            name=color_name,
+            x=_MISSING_COORD if x is None else f"{x:8.3f}",
+            y=_MISSING_COORD if y is None else f"{y:8.3f}",
+        ))
+    if overwrite:
+        lines.append(_ANSI_ERASE_BELOW)
+        sys.stdout.write((_ANSI_ERASE_EOL + "\n").join(lines))
+    else:
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
+    sys.stdout.flush()
 
 
 def _parse_args(argv: List[str]) -> argparse.Namespace:
@@ -178,6 +216,8 @@ def _parse_args(argv: List[str]) -> argparse.Namespace:
 
 def main(argv: List[str] | None = None) -> int:
     args = _parse_args(argv or sys.argv[1:])
+    if args.clear_screen:
+        _enable_vt_mode()
 
     reader = AmongUsReader(process_name=args.process_name, debug=args.debug)
     attached = _attempt_attach(
@@ -199,12 +239,18 @@ def main(argv: List[str] | None = None) -> int:
             _render_snapshot(snapshot)
             return 0
 
+        first_frame = True
+        period = max(0.05, float(args.interval))
+        # 고정 주기로 샘플링: 스냅샷 수집 시간만큼 주기가 밀리지 않도록 마감 시각 기준으로 대기한다.
+        deadline = time.perf_counter() + period
         while True:
             if args.clear_screen:
-                _clear_screen()
+                # 첫 프레임만 전체 지우고 이후에는 커서만 맨 위로 옮겨 덮어쓴다.
+                _clear_screen(full=first_frame)
+                first_frame = False
             snapshot = _collect_snapshot(reader)
-            _render_snapshot(snapshot)
-            time.sleep(max(0.05, float(args.interval)))
+            _render_snapshot(snapshot, overwrite=args.clear_screen)
+            deadline = sleep_until(deadline, period)
     except KeyboardInterrupt:
         print("\n중단합니다.")
         return 0
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import sys
 import time
-from collections import Counter
 from pathlib import Path
 
 
@@ -12,7 +11,7 @@ if str(ROOT_DIR) not in sys.path:
 
 
 from amongus_reader.service import AmongUsReader
-from amongus_reader.service.task_lookup import format_task_entry
+from amongus_reader.service.task_lookup import format_task_entry, task_type_histograms
 
 
 def main() -> None:
@@ -21,6 +20,7 @@ def main() -> None:
         print("Among Us 프로세스에 연결하지 못했습니다.")
         return
 
+    retry_tasks = False
     try:
         while True:
             local_player = reader.get_local_player()
@@ -30,18 +30,17 @@ def main() -> None:
                 time.sleep(0.5)
                 continue
 
-            # always force a fresh read; the first call after 라운드 시작 시 빈 결과가 나올 수 있어 재시도
-            reader.invalidate(["tasks"])
+            # 라운드 시작 직후엔 빈 결과가 캐시될 수 있으므로, 직전 읽기가 비었을 때만 캐시를 비우고 다시 읽음
+            if retry_tasks:
+                reader.invalidate(["tasks"])
             tasks = reader.get_tasks(local_id) if local_id is not None else []
             if not tasks:
                 print("태스크 데이터를 불러오는 중입니다... (다시 시도)")
+                retry_tasks = True
                 time.sleep(0.5)
                 continue
 
-            totals = Counter(t.task_type_id for t in tasks)
-            completed_counts = Counter(
-                t.task_type_id for t in tasks if t.is_completed
-            )
+            totals, completed_counts = task_type_histograms(tasks)
 
             print(f"[플레이어 {local_id}] 태스크 현황:")
             for task in tasks:
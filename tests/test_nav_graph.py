@@ -0,0 +1,95 @@
+import math
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "amongus_reader" / "tools"))
+
+from move import NavGraph
+
+
+def _random_nav(seed: int, n: int = 300, radius: float = 1.6) -> NavGraph:
+    """Random geometric graph with Euclidean edge weights, like a recorded nav graph."""
+    rng = random.Random(seed)
+    pos = [(rng.uniform(-20, 20), rng.uniform(-15, 15)) for _ in range(n)]
+    adj = [[] for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            d = math.hypot(pos[i][0] - pos[j][0], pos[i][1] - pos[j][1])
+            if d <= radius:
+                w = round(d, 4)
+                adj[i].append((j, w))
+                adj[j].append((i, w))
+    indptr = [0]
+    indices = []
+    weights = []
+    for nbrs in adj:
+        for j, w in nbrs:
+            indices.append(j)
+            weights.append(w)
+        indptr.append(len(indices))
+    return NavGraph(np.asarray(pos), np.asarray(indptr), np.asarray(indices), np.asarray(weights))
+
+
+def _path_length(nav: NavGraph, path) -> float:
+    total = 0.0
+    for u, v in zip(path, path[1:]):
+        lo, hi = nav.indptr[u], nav.indptr[u + 1]
+        nbrs = nav.indices[lo:hi].tolist()
+        assert v in nbrs, f"{u} -> {v} is not an edge"
+        total += float(nav.weights[lo + nbrs.index(v)])
+    return total
+
+
+def _reference(nav: NavGraph, s: int, t: int):
+    """Route from a full single-source heapq Dijkstra row."""
+    row = nav._heap_dijkstra(s)
+    path = [t]
+    while path[-1] != s:
+        prev = int(row[path[-1]])
+        if prev < 0:
+            return None
+        path.append(prev)
+    return path[::-1]
+
+
+def test_heap_path_matches_single_source_dijkstra():
+    for seed in range(5):
+        nav = _random_nav(seed)
+        rng = random.Random(100 + seed)
+        for _ in range(40):
+            s = rng.randrange(len(nav))
+            t = rng.randrange(len(nav))
+            ref = _reference(nav, s, t)
+            got = nav._heap_path(s, t)
+            if ref is None:
+                assert got is None
+                continue
+            assert got[0] == s and got[-1] == t
+            assert math.isclose(_path_length(nav, got), _path_length(nav, ref), rel_tol=1e-9, abs_tol=1e-9)
+
+
+def test_heap_path_same_node_and_unreachable():
+    pos = np.array([(0.0, 0.0), (1.0, 0.0), (5.0, 5.0)])
+    nav = NavGraph(pos, np.array([0, 1, 2, 2]), np.array([1, 0]), np.array([1.0, 1.0]))
+    assert nav._heap_path(0, 0) == [0]
+    assert nav._heap_path(0, 1) == [0, 1]
+    assert nav._heap_path(0, 2) is None
+
+
+def test_heap_path_when_weights_undercut_straight_line():
+    # Unit and shrunken weights break a plain Euclidean heuristic; the scaled one must stay exact.
+    for scale_weights in (lambda w: np.ones_like(w), lambda w: w * 0.5):
+        base = _random_nav(7)
+        nav = NavGraph(base.pos, base.indptr, base.indices, scale_weights(base.weights))
+        rng = random.Random(7)
+        for _ in range(40):
+            s = rng.randrange(len(nav))
+            t = rng.randrange(len(nav))
+            ref = _reference(nav, s, t)
+            got = nav._heap_path(s, t)
+            assert (got is None) == (ref is None)
+            if ref is not None:
+                assert math.isclose(_path_length(nav, got), _path_length(nav, ref), rel_tol=1e-9, abs_tol=1e-9)
@@ -0,0 +1,244 @@
+import random
+import struct
+
+import numpy as np
+import pytest
+
+from amongus_reader.il2cpp.scan import Il2CppScanner
+
+PAGE = 0x1000
+
+
+class FakeMemory:
+    """Sparse address space: only the pages in `pages` are readable, like committed memory."""
+
+    def __init__(self, is_64: bool = True, base: int = 0x10000000) -> None:
+        self.is_64 = is_64
+        self.base = base
+        self.pages = {}
+        self.heap_regions = []
+
+    def map_page(self, addr: int) -> None:
+        self.pages.setdefault(addr // PAGE * PAGE, bytearray(PAGE))
+
+    def write_ptr(self, addr: int, value: int) -> None:
+        raw = struct.pack("<Q" if self.is_64 else "<I", value)
+        for i, b in enumerate(raw):
+            self.pages[(addr + i) // PAGE * PAGE][(addr + i) % PAGE] = b
+
+    def read_bytes(self, addr: int, size: int) -> bytes:
+        out = bytearray()
+        for a in range(addr, addr + size):
+            page = self.pages.get(a // PAGE * PAGE)
+            if page is None:
+                raise OSError(f"unreadable address {a:#x}")
+            out.append(page[a % PAGE])
+        return bytes(out)
+
+    def read_into(self, dst: bytearray, addr: int, size: int) -> int:
+        dst[:size] = self.read_bytes(addr, size)
+        return size
+
+    def read_ptr(self, addr: int) -> int:
+        fmt = "<Q" if self.is_64 else "<I"
+        return struct.unpack(fmt, self.read_bytes(addr, struct.calcsize(fmt)))[0]
+
+    def iter_heap_regions(self, max_regions: int = 4096):
+        return iter(self.heap_regions[:max_regions])
+
+
+def _object_at_page_end(is_64: bool):
+    """An object whose field span starts 0x40 bytes before a page that is not mapped."""
+    mem = FakeMemory(is_64=is_64)
+    page = 0x20000000
+    mem.map_page(page)
+    obj = page + PAGE - 0x40 - (0x10 if is_64 else 0x8)
+    step = 8 if is_64 else 4
+    fields = obj + (0x10 if is_64 else 0x8)
+    targets = [0x30000000 + i for i in range(1, 4)]
+    for i, t in enumerate(targets):
+        mem.write_ptr(fields + i * step, t)
+    return mem, obj, fields, targets
+
+
+@pytest.mark.parametrize("is_64", [True, False])
+def test_fields_running_into_unreadable_page_keep_readable_words(is_64):
+    mem, obj, fields, targets = _object_at_page_end(is_64)
+    scanner = Il2CppScanner(mem, meta=None)
+    step = 8 if is_64 else 4
+
+    # Spans of one page or less that end in the unmapped page
+    assert scanner.scan_fields_for_ptr_value(fields, 0x40 + step * 4, targets[2]) == fields + 2 * step
+    assert scanner.object_fields_contains_ptr(obj, targets[1])
+    assert scanner.object_fields_contains_ptr(obj, targets[0], span=0x200)
+    assert scanner.scan_object_field_ptrs(obj, span=0x800) == targets
+    assert not scanner.object_fields_contains_ptr(obj, 0x12345678)
+
+
+@pytest.mark.parametrize("is_64", [True, False])
+def test_span_starting_in_unreadable_page_reads_later_pages(is_64):
+    mem = FakeMemory(is_64=is_64)
+    page = 0x20000000
+    mem.map_page(page + PAGE)
+    mem.write_ptr(page + PAGE + 0x18, 0x30000001)
+    scanner = Il2CppScanner(mem, meta=None)
+    assert scanner.scan_fields_for_ptr_value(page + PAGE - 0x100, 0x200, 0x30000001) == page + PAGE + 0x18
+
+
+def test_fully_unreadable_span_yields_nothing():
+    scanner = Il2CppScanner(FakeMemory(), meta=None)
+    assert list(scanner._iter_ptr_blocks(0x20000000, 0x200)) == []
+    assert scanner.scan_object_field_ptrs(0x20000000) == []
+
+
+@pytest.mark.parametrize("is_64", [True, False])
+def test_field_scans_match_pointer_by_pointer_reads(is_64):
+    # Reference: read every pointer slot on its own and skip the ones that fail.
+    rng = random.Random(1)
+    step = 8 if is_64 else 4
+    fields_off = 0x10 if is_64 else 0x8
+    for _ in range(50):
+        mem = FakeMemory(is_64=is_64)
+        lo = 0x20000000
+        for p in range(8):
+            if rng.random() < 0.6:
+                mem.map_page(lo + p * PAGE)
+                for off in range(0, PAGE, step):
+                    if rng.random() < 0.2:
+                        mem.write_ptr(lo + p * PAGE + off, rng.randrange(1, 1 << (8 * step)))
+        scanner = Il2CppScanner(mem, meta=None)
+        obj = lo + rng.randrange(0, 6 * PAGE, step)
+        span = rng.choice([0x40, 0x200, 0x800, 0x2400])
+
+        def reference(size):
+            out = []
+            for cur in range(obj + fields_off, obj + fields_off + size, step):
+                try:
+                    value = mem.read_ptr(cur)
+                except OSError:
+                    continue
+                if value:
+                    out.append(value)
+            return out
+
+        # Both scans widen short spans to their own minimum
+        assert scanner.scan_object_field_ptrs(obj, span=span) == reference(max(0x100, span))[:512]
+        for value in reference(max(0x40, span))[:3]:
+            assert scanner.object_fields_contains_ptr(obj, value, span=span)
+
+
+def test_heap_scan_results_do_not_depend_on_the_hint():
+    mem = FakeMemory()
+    klass = 0x10001234
+    lo = 0x20000000
+    regions = [(lo, 4 * PAGE), (lo + 0x100000, 4 * PAGE)]
+    for start, size in regions:
+        for p in range(0, size, PAGE):
+            mem.map_page(start + p)
+    # Two early hits, then a dense cluster later on that alone fills the limit
+    hits = [lo + 0x40, lo + 0x1800] + [lo + 0x100000 + 0x2000 + 0x10 * i for i in range(6)]
+    for addr in hits:
+        mem.write_ptr(addr, klass)
+
+    scanner = Il2CppScanner(mem, meta=None)
+    scanner._klass_hint[klass] = hits[-1]
+    assert scanner.scan_heap_for_class_instances(klass, regions, limit=4) == hits[:4]
+    assert scanner.scan_heap_for_class_instances(klass, regions, limit=16) == hits
+    assert Il2CppScanner(mem, meta=None).scan_heap_for_class_instances(klass, regions, limit=4) == hits[:4]
+
+
+@pytest.mark.parametrize("is_64", [True, False])
+def test_class_has_methods_uses_the_scan_pointer_width(is_64):
+    mem = FakeMemory(is_64=is_64)
+    klass = 0x20000000
+    mem.map_page(klass)
+    methods = [0x10002000, 0x10003000]
+    step = 8 if is_64 else 4
+    for i, m in enumerate(methods):
+        mem.write_ptr(klass + 0x100 + i * step, m)
+    scanner = Il2CppScanner(mem, meta=None)
+    assert scanner._ptr_array(methods).dtype == (np.uint64 if is_64 else np.uint32)
+    assert scanner.class_has_methods(klass, methods)
+    assert not scanner.class_has_methods(klass, [methods[0], 0x10004000])
+
+
+def _random_heap(rng, is_64, klasses, n_pages=12):
+    """Heap pages with random words, some of them klass pointers, and a few unmapped holes."""
+    mem = FakeMemory(is_64=is_64)
+    lo = 0x20000000
+    step = 8 if is_64 else 4
+    mem.heap_regions = [(lo, 4 * PAGE), (lo + 0x100000, 8 * PAGE)]
+    for start, size in mem.heap_regions:
+        for p in range(start, start + size, PAGE):
+            if rng.random() < 0.8:
+                mem.map_page(p)
+                for off in range(0, PAGE, step):
+                    r = rng.random()
+                    if r < 0.01:
+                        mem.write_ptr(p + off, rng.choice(klasses))
+                    elif r < 0.1:
+                        mem.write_ptr(p + off, rng.randrange(1, 1 << (8 * step)))
+    return mem
+
+
+@pytest.mark.parametrize("is_64", [True, False])
+def test_heap_class_scan_matches_slot_by_slot_reads(is_64):
+    # Reference: the per-slot loop the block scan replaced.
+    rng = random.Random(2)
+    step = 8 if is_64 else 4
+    klasses = [0x10001000, 0x10002000]
+    for _ in range(10):
+        mem = _random_heap(rng, is_64, klasses)
+        limit = rng.choice([1, 4, 16, 64])
+        ref = []
+        for start, size in mem.heap_regions:
+            for cur in range(start, start + size, step):
+                if len(ref) >= limit:
+                    break
+                try:
+                    if mem.read_ptr(cur) == klasses[0]:
+                        ref.append(cur)
+                except OSError:
+                    continue
+        scanner = Il2CppScanner(mem, meta=None)
+        assert scanner.scan_heap_for_class_instances(klasses[0], mem.heap_regions, limit=limit) == ref
+
+
+@pytest.mark.parametrize("is_64", [True, False])
+def test_method_signature_sweep_matches_slot_by_slot_reads(is_64):
+    # Reference: the per-slot loop that read each candidate klass's method table in full.
+    rng = random.Random(3)
+    step = 8 if is_64 else 4
+    klasses = [0x10001000, 0x10021000, 0x10041000]
+    methods = [0x10500000 + 0x40 * i for i in range(4)]
+    for _ in range(6):
+        mem = _random_heap(rng, is_64, klasses)
+        for klass in klasses:
+            mem.map_page(klass)
+            mem.map_page(klass + 0x8000)
+        # Only the last klass carries two of the wanted methods; one sits past an unmapped gap
+        mem.write_ptr(klasses[0] + 0x100, methods[0])
+        mem.write_ptr(klasses[2] + 0x100, methods[1])
+        mem.write_ptr(klasses[2] + 0x8000 + 0x20, methods[2])
+        ref = 0
+        for start, size in mem.heap_regions:
+            for cur in range(start, start + size, step):
+                try:
+                    klass = mem.read_ptr(cur)
+                except OSError:
+                    continue
+                if not (mem.base <= klass < mem.base + 0x05000000):
+                    continue
+                hits = 0
+                for addr in range(klass, klass + 0x10000, step):
+                    try:
+                        hits += mem.read_ptr(addr) in methods
+                    except OSError:
+                        continue
+                if hits >= 2:
+                    ref = cur
+                    break
+            if ref:
+                break
+        scanner = Il2CppScanner(mem, meta=None)
+        assert scanner.find_object_by_method_signature(methods, None) == ref
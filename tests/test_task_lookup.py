@@ -0,0 +1,61 @@
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+
+from amongus_reader.service.task_lookup import format_task_entry
+
+
+def _entry(task_type_id, location, destination=None, step=None, max_step=None):
+    task = SimpleNamespace(
+        task_id=1,
+        task_type_id=task_type_id,
+        is_completed=False,
+        step=step,
+        max_step=max_step,
+        location=location,
+        destination=destination,
+    )
+    return format_task_entry(task, Counter([task_type_id]), Counter())
+
+
+# Expected values were taken from the panel code before format_task_entry was reworked.
+@pytest.mark.parametrize(
+    "task_type_id, location, text, canonical_room, coordinates",
+    [
+        (0x0C, "Electrical", "Electrical: Fix Wiring (0/3)", "Electrical", (-7.59, -8.11)),
+        (0x0C, "O2", "O2: Fix Wiring (0/3)", "Oxygen", (14.59, -4.4)),
+        (0x0C, "oxygen", "O2: Fix Wiring (0/3)", "oxygen", (14.59, -4.4)),
+        # Unknown or missing rooms fall back to the first coordinate, but a reported room stays on the panel
+        (0x0C, "Weird", "Weird: Fix Wiring (0/3)", "Weird", (14.59, -4.4)),
+        (0x0C, None, "Navigation: Fix Wiring (0/3)", "Navigation", (14.59, -4.4)),
+        # No coordinate table for the task type at all
+        (0x07, "Cafeteria", "Cafeteria: Upload Data (0/2)", "Cafeteria", None),
+        (100, "Storage", "Storage: TaskType#100", "Storage", None),
+    ],
+)
+def test_task_location_resolution(task_type_id, location, text, canonical_room, coordinates):
+    entry = _entry(task_type_id, location)
+    assert entry.display_text() == text
+    assert entry.canonical_room == canonical_room
+    assert entry.coordinates == coordinates
+
+
+@pytest.mark.parametrize(
+    "task_type_id, location, destination, step, max_step, text",
+    [
+        (0x0B, "Upper Engine", None, None, None, "Upper Engine: Align Engine Output (0/2)"),
+        (0x0B, "Lower Engine", None, None, None, "Lower Engine: Align Engine Output (1/2)"),
+        (0x07, "Admin", None, None, None, "Admin: Upload Data (1/2)"),
+        (0x0E, "Electrical", None, None, None, "Electrical: Divert Power to Weapons (0/2)"),
+        (0x0E, "Electrical", "Weapons", None, None, "Electrical: Divert Power to Weapons (0/2)"),
+        (0x0E, "Electrical", 0x0C, None, None, "Electrical: Divert Power to Weapons (0/2)"),
+        (0x0E, "Weapons", None, None, None, "Weapons: Accept Diverted Power (0/2)"),
+        (0x0D, "Electrical", None, 1, 3, "Electrical: Calibrate Distributor"),
+        (0x04, "Storage", None, 1, 2, "Storage: Start Reactor"),
+        (0x02, "Storage", None, 1, 2, "Storage: Fuel Engines (1/2)"),
+        (0x06, "Weapons", None, None, None, "Weapons: Clear Asteroids (0/20)"),
+    ],
+)
+def test_task_stage_progress(task_type_id, location, destination, step, max_step, text):
+    assert _entry(task_type_id, location, destination, step, max_step).display_text() == text